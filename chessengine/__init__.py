@@ -5,26 +5,36 @@ import chess
 from .searchers import Searcher
 
 
-def get_next_move(board: chess.Board, searcher: Searcher) -> tuple[chess.Move, float]:
-    """Find the best next move for the current position of `board` using the provided `searcher`."""
-    best_move = None
-    best_value = -99_999
+def get_next_move(board: chess.Board, searcher: Searcher) -> tuple[chess.Move | None, int]:
+    """Find the best next move for the current position of `board` using the provided `searcher`.
 
-    if board.turn == chess.BLACK:
-        best_value = 99_999
+    The root of the search tree is part of a single search, so the alpha-beta window is shared among the root moves. The
+    best move is the first move of the principal variation of the search result, or `None` if the game is over. A
+    searcher of depth `n` thereby looks `n` plies ahead, including the root moves.
+
+    A search that ends without moves although the game isn't over, e.g. one of depth zero, which only evaluates the
+    position itself, falls back to searching the position after each legal move and picking the best of them."""
+    search_result = searcher.search(board)
+    if search_result.moves:
+        return search_result.moves[0], search_result.get_effective_score()
+
+    if any(board.generate_legal_moves()):
+        return _get_best_root_move(board, searcher)
+
+    return None, search_result.get_effective_score()
+
+
+def _get_best_root_move(board: chess.Board, searcher: Searcher) -> tuple[chess.Move, int]:
+    # search the position after each root move separately and pick the best one for the side to move
+    color = 1 if board.turn == chess.WHITE else -1
+    best_move, best_value = None, None
 
     for move in board.legal_moves:
         board.push(move)
-        value = searcher.search(board)
+        value = searcher.search(board).get_effective_score()
         board.pop()
 
-        if board.turn == chess.WHITE:
-            if value > best_value:
-                best_value = value
-                best_move = move
-        else:
-            if value < best_value:
-                best_value = value
-                best_move = move
+        if best_move is None or color * value > color * best_value:
+            best_move, best_value = move, value
 
     return best_move, best_value
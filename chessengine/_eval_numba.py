@@ -0,0 +1,27 @@
+"""Numba-compiled kernels for the evaluators"""
+
+from numba import njit
+import numpy as np
+
+
+@njit(cache=True)
+def eval_kernel(bitboards: np.ndarray, white: np.uint64, tables: np.ndarray) -> int:
+    """Sums the piece-square values of the pieces of white minus those of black.
+
+    `bitboards` holds one uint64 bitboard per piece type, `white` is the occupancy of white and `tables` holds the
+    piece-square values indexed by color, piece type, and square."""
+    score = 0
+    one = np.uint64(1)
+
+    for piece_index in range(bitboards.shape[0]):
+        pieces = bitboards[piece_index]
+
+        for square in range(64):
+            mask = one << np.uint64(square)
+            if pieces & mask:
+                if white & mask:
+                    score += tables[1, piece_index, square]
+                else:
+                    score -= tables[0, piece_index, square]
+
+    return score
@@ -1,63 +1,201 @@
 """Caching evaluation results"""
 
 from dataclasses import dataclass
+from enum import IntEnum
 
-from cachetools import LRUCache
 import chess
+import chess.polyglot
+import numpy as np
 
+from .zobrist import HashedBoard
 
-@dataclass
+
+class NodeType(IntEnum):
+    """How the cached value of a node relates to its true value, as determined by the alpha-beta window"""
+    EXACT = 0
+    """The value is exact."""
+    LOWER_BOUND = 1
+    """The search failed high, the true value is at least the cached value."""
+    UPPER_BOUND = 2
+    """The search failed low, the true value is at most the cached value."""
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """Entries of the chess cache"""
     depth: int
-    value: float
+    value: int
+    best_move: chess.Move | None = None
+    node_type: NodeType = NodeType.EXACT
 
 
 class ChessCache:
-    """Cache for search-enhanced evaluations of positions"""
+    """Cache for search-enhanced evaluations of positions
+
+    The cache is a transposition table of fixed size, backed by one numpy array per entry field, so that probing a slot
+    only reads a few contiguous values. Positions are mapped to a slot by the lower bits of their Zobrist hash, which
+    callers pass in as key, see :meth:`get_cache_key`. If two positions compete for the same slot, the newer one
+    replaces the older one, while for the same position an entry is only replaced by one from an at least equally deep
+    search.
+
+    The arrays can be placed in a given `buffer` of at least :meth:`buffer_size` bytes, e.g. shared memory, so that
+    several processes can work on the same cache. A new buffer is allocated and cleared otherwise, while a given buffer
+    is used as it is, see :meth:`clear`. Processes sharing a cache don't lock its entries, so an entry that two
+    processes write at the same time may mix both. That is rare enough to accept, and a mixed up best move does no
+    harm, because the search only uses cached moves that it has generated itself."""
+
+    # types of the entry fields keys, values, depths, best moves and node types, ordered by their alignment
+    _FIELD_TYPES = (np.uint64, np.int32, np.int16, np.uint16, np.uint8)
+
+    def __init__(self, maxsize, buffer=None):
+        self.size = 1 << max(int(maxsize) - 1, 0).bit_length()
+
+        allocate = buffer is None
+        if allocate:
+            buffer = bytearray(self.buffer_size(maxsize))
+
+        arrays = []
+        offset = 0
+        for dtype in self._FIELD_TYPES:
+            arrays.append(np.frombuffer(buffer, dtype=dtype, count=self.size, offset=offset))
+            offset += self.size * np.dtype(dtype).itemsize
+        self.keys, self.values, self.depths, self.best_moves, self.node_types = arrays
+
+        if allocate:
+            self.clear()
 
-    def __init__(self, maxsize):
-        self.cache = LRUCache(maxsize=maxsize)
         self.hits = 0
         self.misses = 0
 
-    def contains(self, board: chess.Board, depth: int) -> bool:
-        """Checks if board is present in cache with at least the specified depth"""
-        key = self.get_cache_key(board)
+    @classmethod
+    def buffer_size(cls, maxsize) -> int:
+        """Number of bytes of the arrays of a cache with `maxsize` entries"""
+        size = 1 << max(int(maxsize) - 1, 0).bit_length()
+        return size * sum(np.dtype(dtype).itemsize for dtype in cls._FIELD_TYPES)
 
-        if key not in self.cache:
-            self.misses += 1
-            return False
+    def clear(self) -> None:
+        """Removes all entries from the cache"""
+        self.keys[:] = 0
+        self.depths[:] = -1
+
+    def contains(self, key: int, depth: int) -> bool:
+        """Checks if the board with cache key `key` is present in cache with at least the specified depth"""
+        idx = key & (self.size - 1)
 
-        entry = self.cache[key]
-        if entry.depth < depth:
+        if self.keys.item(idx) != key or self.depths.item(idx) < depth:
             self.misses += 1
             return False
 
         self.hits += 1
         return True
 
-    def insert_or_update(self, board: chess.Board, depth: int, value: float) -> None:
-        """Inserts the given board and depth into the cache.
+    def insert_or_update(self, key: int, depth: int, value: int, best_move: chess.Move | None = None,
+                         node_type: NodeType = NodeType.EXACT) -> None:
+        """Inserts the board with cache key `key` and depth into the cache.
+
+        Overwrites an entry of a different position in the same slot unconditionally, but an entry of the same position
+        only if `depth` is at least the depth of the stored entry."""
+
+        idx = key & (self.size - 1)
+
+        if self.keys.item(idx) == key and self.depths.item(idx) > depth:
+            return
+
+        self.keys[idx] = key
+        self.depths[idx] = depth
+        self.values[idx] = value
+        self.best_moves[idx] = _encode_move(best_move)
+        self.node_types[idx] = node_type
 
-        Overwrites if there already is an entry at the key generated from the board, regardless of
-        depth."""
+    def get_value(self, key: int) -> int:
+        """Retrieves the value of the board with cache key `key` from cache at whatever depth it is stored."""
 
-        key = self.get_cache_key(board)
-        entry = CacheEntry(depth=depth, value=value)
-        self.cache[key] = entry
+        entry = self.get_entry(key)
+        if entry is None:
+            raise KeyError(key)
 
-    def get_value(self, board: chess.Board) -> float:
-        """Retrieves the value of the board from cache at whatever depth it is stored."""
+        return entry.value
 
-        return self.cache[self.get_cache_key(board)].value
+    def get_entry(self, key: int) -> CacheEntry | None:
+        """Retrieves the complete cache entry of the board with cache key `key` at whatever depth it is stored, or
+        `None` if the board is not present in the cache."""
+
+        idx = key & (self.size - 1)
+
+        # `item` returns python scalars, which is a lot cheaper than indexing into numpy scalars and converting them
+        depth = self.depths.item(idx)
+        if self.keys.item(idx) != key or depth < 0:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return CacheEntry(depth, self.values.item(idx), _decode_move(self.best_moves.item(idx)),
+                          _NODE_TYPES[self.node_types.item(idx)])
 
     @staticmethod
-    def get_cache_key(board: chess.Board) -> str:
+    def get_cache_key(board: chess.Board) -> int:
         """Constructs a cache key from a board state.
 
-        Currently, that includes the piece placement, active color, castling availability, and en passant square, i.e.,
-        the first four entries of the FEN. The half move clock is omitted, because it probably doesn't become relevant
-        enough often enough to matter in caching."""
+        The key is the Zobrist hash of the board, which covers the piece placement, active color, castling availability,
+        and en passant square. The half move clock is omitted, because it probably doesn't become relevant enough often
+        enough to matter in caching. For a :class:`HashedBoard`, this is the incrementally maintained key, otherwise the
+        hash is computed from scratch."""
+
+        if isinstance(board, HashedBoard):
+            return board.key
+
+        return chess.polyglot.zobrist_hash(board)
+
+
+_NODE_TYPES = tuple(NodeType)
+
+# decoded moves by their code, so that probing the cache doesn't construct a new move every time
+_decoded_moves: dict[int, chess.Move | None] = {0: None}
+
+
+def _encode_move(move: chess.Move | None) -> int:
+    # pack from square, to square and promotion piece into 16 bits, zero means no move
+    if not move:
+        return 0
+
+    return move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+
+
+def _decode_move(code: int) -> chess.Move | None:
+    try:
+        return _decoded_moves[code]
+    except KeyError:
+        move = _decoded_moves[code] = chess.Move(code & 63, code >> 6 & 63, code >> 12 or None)
+        return move
+
+
+class EvaluationCache:
+    """Cache for static evaluations of positions, keyed by Zobrist hash
+
+    Unlike the values in :class:`ChessCache`, static evaluations don't depend on search depth or alpha-beta window, so
+    they can be reused whenever the same position is evaluated again. The cache has a fixed number of slots, and a
+    position simply evicts whichever position occupied its slot before."""
+
+    def __init__(self, maxsize):
+        self.size = 1 << max(int(maxsize) - 1, 0).bit_length()
+        self.keys: list[int | None] = [None] * self.size
+        self.values: list[int] = [0] * self.size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: int) -> int | None:
+        """Retrieves the evaluation of the position with Zobrist hash `key`, or `None` if it isn't cached"""
+        idx = key & (self.size - 1)
+
+        if self.keys[idx] != key:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self.values[idx]
 
-        return " ".join(board.fen().split(" ")[:4])
+    def insert(self, key: int, value: int) -> None:
+        """Stores the evaluation of the position with Zobrist hash `key`"""
+        idx = key & (self.size - 1)
+        self.keys[idx] = key
+        self.values[idx] = value
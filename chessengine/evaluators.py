@@ -1,16 +1,26 @@
 """Position evaluation functions"""
 
 from abc import ABC, abstractmethod
+import array
+from typing import Sequence
 
 import chess
+import numpy as np
 
 
 # pylint: disable=too-few-public-methods
 class Evaluator(ABC):
     """Function to evaluate a given chess position"""
     @abstractmethod
-    def eval(self, board: chess.Board) -> float:
-        """Takes the current position of `board` and returns an evaluation score in centi pawns"""
+    def eval(self, board: chess.Board) -> int:
+        """Takes the current position of `board` and returns an evaluation score in whole centi pawns"""
+
+    def eval_batch(self, boards: Sequence[chess.Board]) -> np.ndarray:
+        """Evaluates the positions of all `boards` at once and returns their scores in an array, in the same order.
+
+        Evaluators that can vectorize over positions should override this, by default :meth:`eval` is called for each
+        board."""
+        return np.array([self.eval(board) for board in boards])
 
 
 class SimpleEvaluator(Evaluator):
@@ -24,18 +34,12 @@ class SimpleEvaluator(Evaluator):
         chess.QUEEN:  900,
     }
 
-    def eval(self, board: chess.Board) -> float:
-        scores = {chess.WHITE: 0, chess.BLACK: 0}
-
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
+    def __init__(self):
+        # piece values from pawn to queen, taken from the instance so that overridden values are honored
+        self._material_values = tuple(self.PIECE_VALUES[piece_type] for piece_type in chess.PIECE_TYPES[:5])
 
-            if piece is None or piece.piece_type == chess.KING:
-                continue
-
-            scores[piece.color] += self.PIECE_VALUES[piece.piece_type]
-
-        return scores[chess.WHITE] - scores[chess.BLACK]
+    def eval(self, board: chess.Board) -> int:
+        return material_balance(board, self._material_values)
 
 
 class SimpleHandCraftedEvaluator(Evaluator):
@@ -60,18 +64,92 @@ class SimpleHandCraftedEvaluator(Evaluator):
         chess.QUEEN:  900,
     }
 
-    def eval(self, board: chess.Board) -> float:
-        scores = {chess.WHITE: 0, chess.BLACK: 0}
+    def __init__(self):
+        # piece value plus positional bonus by [color][piece type - 1][square], the table for black is the vertically
+        # mirrored table for white
+        table = [self.PIECE_SQUARE_TABLE[chess.square_file(square)][chess.square_rank(square)]
+                 for square in chess.SQUARES]
+        self._tables = tuple(
+            tuple(array.array("i", (value + table[square if color == chess.WHITE else chess.square_mirror(square)]
+                                    for square in chess.SQUARES))
+                  for value in self.PIECE_VALUES.values())
+            for color in chess.COLORS[::-1]
+        )
+        self._table_array = np.array(self._tables, dtype=np.int32)
+
+    def eval(self, board: chess.Board) -> int:
+        black, white = board.occupied_co
+        black_tables, white_tables = self._tables
+        score = 0
+
+        for pieces, white_table, black_table in zip(
+                (board.pawns, board.knights, board.bishops, board.rooks, board.queens), white_tables, black_tables):
+            for square in chess.scan_forward(pieces & white):
+                score += white_table[square]
+            for square in chess.scan_forward(pieces & black):
+                score -= black_table[square]
+
+        return score
+
+    def eval_batch(self, boards: Sequence[chess.Board]) -> np.ndarray:
+        return piece_square_balance(boards, self._table_array)
+
+
+class NumbaHandCraftedEvaluator(SimpleHandCraftedEvaluator):
+    """Same evaluation as :class:`SimpleHandCraftedEvaluator`, but computed in a Numba-compiled kernel
+
+    Numba is only imported when the first instance is created, so the other evaluators can be used without it."""
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        from ._eval_numba import eval_kernel
+
+        super().__init__()
+        self._kernel = eval_kernel
+        self._scratch = np.zeros(self._table_array.shape[1], dtype=np.uint64)
+
+        # compile the kernel now rather than in the first evaluation
+        eval_kernel(self._scratch, np.uint64(0), self._table_array)
+
+    def eval(self, board: chess.Board) -> int:
+        scratch = self._scratch
+        scratch[0] = board.pawns
+        scratch[1] = board.knights
+        scratch[2] = board.bishops
+        scratch[3] = board.rooks
+        scratch[4] = board.queens
+
+        return int(self._kernel(scratch, np.uint64(board.occupied_co[chess.WHITE]), self._table_array))
+
+
+def material_balance(board: chess.Board, piece_values: tuple[int, int, int, int, int]) -> int:
+    """Difference of the summed piece values of white and black, computed from popcounts of the piece bitboards
+
+    `piece_values` are the values of pawns, knights, bishops, rooks, and queens, in this order."""
+    black, white = board.occupied_co
+    pawn, knight, bishop, rook, queen = piece_values
+    pawns, knights, bishops, rooks, queens = board.pawns, board.knights, board.bishops, board.rooks, board.queens
+
+    # unrolled, because a loop over the piece types costs more than the popcounts themselves
+    return (pawn * ((pawns & white).bit_count() - (pawns & black).bit_count())
+            + knight * ((knights & white).bit_count() - (knights & black).bit_count())
+            + bishop * ((bishops & white).bit_count() - (bishops & black).bit_count())
+            + rook * ((rooks & white).bit_count() - (rooks & black).bit_count())
+            + queen * ((queens & white).bit_count() - (queens & black).bit_count()))
+
 
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
+def piece_square_balance(boards: Sequence[chess.Board], tables: np.ndarray) -> np.ndarray:
+    """Differences of the summed values of the white and the black pieces of all `boards`, where `tables` holds the
+    value of each piece by ``[color][piece type - 1][square]``, with black first and kings left out.
 
-            if piece is None or piece.piece_type == chess.KING:
-                continue
+    The pieces of each board are unpacked into a ``(2, 5, 64)`` occupancy array, so that all boards are evaluated in a
+    single contraction with the tables."""
+    bitboards = np.array([(board.pawns, board.knights, board.bishops, board.rooks, board.queens, *board.occupied_co)
+                          for board in boards], dtype="<u8").reshape(-1, 7)
 
-            scores[piece.color] += (
-                self.PIECE_VALUES[piece.piece_type]
-                + self.PIECE_SQUARE_TABLE[chess.square_file(square)][chess.square_rank(square)]
-            )
+    # the pieces of each type by color, unpacked into one byte per square in the little endian order of the squares
+    pieces = bitboards[:, None, :5] & bitboards[:, 5:, None]
+    occupancy = np.unpackbits(pieces.view(np.uint8).reshape(*pieces.shape, 8), axis=-1, bitorder="little")
 
-        return scores[chess.WHITE] - scores[chess.BLACK]
+    values = np.einsum("ncps,cps->nc", occupancy, tables, dtype=np.int64)
+    return values[:, 1] - values[:, 0]
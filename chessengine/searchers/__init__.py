@@ -1,5 +1,16 @@
 """Move tree searching functions"""
 
-from .abstract import Searcher, SearchResult, SearchResultType
+from .abstract import MATE_SCORE, Searcher, SearchResult, SearchResultType
 from .alpha_beta_searcher import AlphaBetaSearcher
 from .minimax_searcher import MinimaxSearcher
+from .parallel_searcher import LazySMPSearcher, ParallelRootSearcher
+
+
+def __getattr__(name: str):
+    # the Numba searcher is imported on first access only, so that the other searchers can be used without numba
+    if name == "NumbaAlphaBetaSearcher":
+        # pylint: disable=import-outside-toplevel
+        from .numba_searcher import NumbaAlphaBetaSearcher
+        return NumbaAlphaBetaSearcher
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,391 @@
+"""Numba-compiled alpha-beta search on a mailbox and bitboard representation of the board
+
+Positions are held in preallocated arrays with one slot per ply, so that making a move copies the position of the
+current ply into the next one and modifies it there, and unmaking a move is just going back to the current ply. Each
+slot consists of a bitboard per color and piece type, a mailbox with the piece on each square, and the state, which is
+the side to move, the castling rights, the en passant square and the squares of the two kings. Squares, colors and the
+order of the piece types are the same as in python-chess, except that piece types start at zero."""
+
+import chess
+from numba import njit
+import numpy as np
+
+from .abstract import MATE_SCORE
+
+BLACK, WHITE = 0, 1
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+NO_PIECE = -1
+NO_SQUARE = -1
+
+# columns of the state
+SIDE_TO_MOVE, CASTLING, EP_SQUARE, BLACK_KING, WHITE_KING = range(5)
+STATE_SIZE = 5
+
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+
+# moves are packed into integers as from square | to square << 6 | promotion piece type << 12 | flag << 15
+FLAG_EN_PASSANT = 1
+FLAG_CASTLING = 2
+FLAG_DOUBLE_PUSH = 4
+
+DARK_SQUARES = np.uint64(chess.BB_DARK_SQUARES)
+LIGHT_SQUARES = np.uint64(chess.BB_LIGHT_SQUARES)
+
+MAX_MOVES = 256
+INFINITY = 1 << 30
+
+
+def _step_targets(steps: tuple[tuple[int, int], ...]) -> np.ndarray:
+    # bitboards of the squares reached from each square by one of the (file, rank) `steps`
+    targets = np.zeros(64, dtype=np.uint64)
+    for square in range(64):
+        for file_step, rank_step in steps:
+            file, rank = (square & 7) + file_step, (square >> 3) + rank_step
+            if 0 <= file < 8 and 0 <= rank < 8:
+                targets[square] |= np.uint64(1) << np.uint64(8 * rank + file)
+    return targets
+
+
+KNIGHT_STEPS = np.array([(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)], dtype=np.int64)
+KING_STEPS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)], dtype=np.int64)
+# the first four directions are those of the rook, the last four those of the bishop
+DIRECTIONS = KING_STEPS
+
+KNIGHT_ATTACKS = _step_targets(tuple(map(tuple, KNIGHT_STEPS)))
+KING_ATTACKS = _step_targets(tuple(map(tuple, KING_STEPS)))
+# squares attacked by a pawn of a color on a square
+PAWN_ATTACKS = np.stack([_step_targets(((-1, -1), (1, -1))), _step_targets(((-1, 1), (1, 1)))])
+
+# castling rights that survive a move from or to a square
+CASTLING_KEEP = np.full(64, 15, dtype=np.int64)
+CASTLING_KEEP[4] &= ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLING_KEEP[7] &= ~WHITE_KINGSIDE
+CASTLING_KEEP[0] &= ~WHITE_QUEENSIDE
+CASTLING_KEEP[60] &= ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLING_KEEP[63] &= ~BLACK_KINGSIDE
+CASTLING_KEEP[56] &= ~BLACK_QUEENSIDE
+
+
+@njit(cache=True)
+def is_attacked(bitboards: np.ndarray, mailbox: np.ndarray, square: int, by: int) -> bool:
+    """Whether `square` is attacked by a piece of color `by`"""
+    if KNIGHT_ATTACKS[square] & bitboards[by, KNIGHT]:
+        return True
+    if KING_ATTACKS[square] & bitboards[by, KING]:
+        return True
+    # a pawn attacks the square if a pawn of the other color on the square would attack the pawn
+    if PAWN_ATTACKS[1 - by, square] & bitboards[by, PAWN]:
+        return True
+
+    for direction in range(8):
+        file_step, rank_step = DIRECTIONS[direction, 0], DIRECTIONS[direction, 1]
+        file, rank = (square & 7) + file_step, (square >> 3) + rank_step
+
+        while 0 <= file < 8 and 0 <= rank < 8:
+            piece = mailbox[8 * rank + file]
+            if piece != NO_PIECE:
+                if piece // 6 == by:
+                    piece_type = piece % 6
+                    if piece_type == QUEEN or piece_type == (ROOK if direction < 4 else BISHOP):
+                        return True
+                break
+            file += file_step
+            rank += rank_step
+
+    return False
+
+
+@njit(cache=True)
+def _add_pawn_moves(moves: np.ndarray, count: int, from_square: int, to_square: int, promotion_rank: int) -> int:
+    # adds the pawn move, or one move per promotion piece if the pawn reaches the last rank
+    if to_square >> 3 != promotion_rank:
+        moves[count] = from_square | to_square << 6
+        return count + 1
+
+    for promotion in (QUEEN, ROOK, BISHOP, KNIGHT):
+        moves[count] = from_square | to_square << 6 | promotion << 12
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def generate_moves(bitboards: np.ndarray, mailbox: np.ndarray, state: np.ndarray, moves: np.ndarray) -> int:
+    """Writes the pseudo-legal moves of the position into `moves` and returns their number
+
+    Castling is only generated if it's legal, all other moves may still leave the own king in check."""
+    us = state[SIDE_TO_MOVE]
+    them = 1 - us
+    count = 0
+
+    for square in range(64):
+        piece = mailbox[square]
+        if piece == NO_PIECE or piece // 6 != us:
+            continue
+
+        piece_type = piece % 6
+        file, rank = square & 7, square >> 3
+
+        if piece_type == PAWN:
+            forward = 8 if us == WHITE else -8
+            promotion_rank = 7 if us == WHITE else 0
+
+            target = square + forward
+            if mailbox[target] == NO_PIECE:
+                count = _add_pawn_moves(moves, count, square, target, promotion_rank)
+                if rank == (1 if us == WHITE else 6) and mailbox[target + forward] == NO_PIECE:
+                    moves[count] = square | (target + forward) << 6 | FLAG_DOUBLE_PUSH << 15
+                    count += 1
+
+            for file_step in (-1, 1):
+                if 0 <= file + file_step < 8:
+                    target = square + forward + file_step
+                    victim = mailbox[target]
+                    if victim != NO_PIECE and victim // 6 == them:
+                        count = _add_pawn_moves(moves, count, square, target, promotion_rank)
+                    elif target == state[EP_SQUARE]:
+                        moves[count] = square | target << 6 | FLAG_EN_PASSANT << 15
+                        count += 1
+
+        elif piece_type == KNIGHT or piece_type == KING:
+            steps = KNIGHT_STEPS if piece_type == KNIGHT else KING_STEPS
+            for step in range(8):
+                target_file, target_rank = file + steps[step, 0], rank + steps[step, 1]
+                if 0 <= target_file < 8 and 0 <= target_rank < 8:
+                    target = 8 * target_rank + target_file
+                    victim = mailbox[target]
+                    if victim == NO_PIECE or victim // 6 == them:
+                        moves[count] = square | target << 6
+                        count += 1
+
+        else:
+            first_direction = 4 if piece_type == BISHOP else 0
+            last_direction = 4 if piece_type == ROOK else 8
+            for direction in range(first_direction, last_direction):
+                file_step, rank_step = DIRECTIONS[direction, 0], DIRECTIONS[direction, 1]
+                target_file, target_rank = file + file_step, rank + rank_step
+
+                while 0 <= target_file < 8 and 0 <= target_rank < 8:
+                    target = 8 * target_rank + target_file
+                    victim = mailbox[target]
+                    if victim == NO_PIECE or victim // 6 == them:
+                        moves[count] = square | target << 6
+                        count += 1
+                    if victim != NO_PIECE:
+                        break
+                    target_file += file_step
+                    target_rank += rank_step
+
+    # the king may neither castle out of, through nor into check
+    castling = state[CASTLING]
+    king = 4 if us == WHITE else 60
+    kingside, queenside = (WHITE_KINGSIDE, WHITE_QUEENSIDE) if us == WHITE else (BLACK_KINGSIDE, BLACK_QUEENSIDE)
+    if castling & (kingside | queenside) and not is_attacked(bitboards, mailbox, king, them):
+        if (castling & kingside and mailbox[king + 1] == NO_PIECE and mailbox[king + 2] == NO_PIECE
+                and not is_attacked(bitboards, mailbox, king + 1, them)
+                and not is_attacked(bitboards, mailbox, king + 2, them)):
+            moves[count] = king | (king + 2) << 6 | FLAG_CASTLING << 15
+            count += 1
+        if (castling & queenside and mailbox[king - 1] == NO_PIECE and mailbox[king - 2] == NO_PIECE
+                and mailbox[king - 3] == NO_PIECE
+                and not is_attacked(bitboards, mailbox, king - 1, them)
+                and not is_attacked(bitboards, mailbox, king - 2, them)):
+            moves[count] = king | (king - 2) << 6 | FLAG_CASTLING << 15
+            count += 1
+
+    return count
+
+
+@njit(cache=True)
+def _move_piece(bitboards: np.ndarray, mailbox: np.ndarray, from_square: int, to_square: int) -> None:
+    piece = mailbox[from_square]
+    one = np.uint64(1)
+    bitboards[piece // 6, piece % 6] ^= (one << np.uint64(from_square)) | (one << np.uint64(to_square))
+    mailbox[to_square] = piece
+    mailbox[from_square] = NO_PIECE
+
+
+@njit(cache=True)
+def _remove_piece(bitboards: np.ndarray, mailbox: np.ndarray, square: int) -> None:
+    piece = mailbox[square]
+    bitboards[piece // 6, piece % 6] ^= np.uint64(1) << np.uint64(square)
+    mailbox[square] = NO_PIECE
+
+
+@njit(cache=True)
+def make_move(bitboards: np.ndarray, mailboxes: np.ndarray, states: np.ndarray, ply: int, move: int) -> None:
+    """Sets up the position at `ply + 1` as the position at `ply` after `move`"""
+    next_bitboards, next_mailbox, next_state = bitboards[ply + 1], mailboxes[ply + 1], states[ply + 1]
+    next_bitboards[:] = bitboards[ply]
+    next_mailbox[:] = mailboxes[ply]
+    next_state[:] = states[ply]
+
+    us = states[ply, SIDE_TO_MOVE]
+    from_square, to_square = move & 63, move >> 6 & 63
+    promotion, flag = move >> 12 & 7, move >> 15
+
+    if next_mailbox[to_square] != NO_PIECE:
+        _remove_piece(next_bitboards, next_mailbox, to_square)
+    _move_piece(next_bitboards, next_mailbox, from_square, to_square)
+
+    if promotion:
+        _remove_piece(next_bitboards, next_mailbox, to_square)
+        next_bitboards[us, promotion] ^= np.uint64(1) << np.uint64(to_square)
+        next_mailbox[to_square] = 6 * us + promotion
+    elif flag == FLAG_EN_PASSANT:
+        _remove_piece(next_bitboards, next_mailbox, to_square - 8 if us == WHITE else to_square + 8)
+    elif flag == FLAG_CASTLING:
+        if to_square > from_square:
+            _move_piece(next_bitboards, next_mailbox, from_square + 3, from_square + 1)
+        else:
+            _move_piece(next_bitboards, next_mailbox, from_square - 4, from_square - 1)
+
+    if next_mailbox[to_square] % 6 == KING:
+        next_state[WHITE_KING if us == WHITE else BLACK_KING] = to_square
+
+    next_state[SIDE_TO_MOVE] = 1 - us
+    next_state[CASTLING] &= CASTLING_KEEP[from_square] & CASTLING_KEEP[to_square]
+    next_state[EP_SQUARE] = (from_square + to_square) // 2 if flag == FLAG_DOUBLE_PUSH else NO_SQUARE
+
+
+@njit(cache=True)
+def _king_in_check(bitboards: np.ndarray, mailbox: np.ndarray, state: np.ndarray, color: int) -> bool:
+    king = state[WHITE_KING if color == WHITE else BLACK_KING]
+    return is_attacked(bitboards, mailbox, king, 1 - color)
+
+
+@njit(cache=True)
+def evaluate(mailbox: np.ndarray, tables: np.ndarray) -> int:
+    """Sums the piece-square values of the pieces of white minus those of black, kings don't count
+
+    `tables` holds the piece-square values indexed by color, piece type and square."""
+    score = 0
+    for square in range(64):
+        piece = mailbox[square]
+        if piece != NO_PIECE and piece % 6 != KING:
+            if piece // 6 == WHITE:
+                score += tables[WHITE, piece % 6, square]
+            else:
+                score -= tables[BLACK, piece % 6, square]
+    return score
+
+
+@njit(cache=True)
+def _has_insufficient_material(bitboards: np.ndarray, color: int) -> bool:
+    # whether `color` can't possibly mate, by the same rules as :meth:`chess.Board.has_insufficient_material`
+    if bitboards[color, PAWN] or bitboards[color, ROOK] or bitboards[color, QUEEN]:
+        return False
+
+    if bitboards[color, KNIGHT]:
+        # a lone knight can only mate if the opponent has pieces to block its king, a queen can't get in the way
+        pieces = bitboards[color, KNIGHT] | bitboards[color, BISHOP] | bitboards[color, KING]
+        more_than_two = pieces & (pieces - np.uint64(1))
+        more_than_two &= more_than_two - np.uint64(1)
+        opponent = 1 - color
+        return not more_than_two and not (bitboards[opponent, PAWN] | bitboards[opponent, KNIGHT]
+                                          | bitboards[opponent, BISHOP] | bitboards[opponent, ROOK])
+
+    bishops = bitboards[BLACK, BISHOP] | bitboards[WHITE, BISHOP]
+    if bitboards[color, BISHOP]:
+        same_color = not bishops & DARK_SQUARES or not bishops & LIGHT_SQUARES
+        return same_color and not (bitboards[BLACK, PAWN] | bitboards[WHITE, PAWN] | bitboards[BLACK, KNIGHT]
+                                   | bitboards[WHITE, KNIGHT])
+
+    return True
+
+
+@njit(cache=True)
+def is_insufficient_material(bitboards: np.ndarray) -> bool:
+    """Whether neither side has the material to mate, like :meth:`chess.Board.is_insufficient_material`"""
+    return _has_insufficient_material(bitboards, WHITE) and _has_insufficient_material(bitboards, BLACK)
+
+
+@njit(cache=True)
+def _move_order_score(mailbox: np.ndarray, move: int) -> int:
+    # captures by most valuable victim and least valuable attacker, then promotions, then all other moves
+    score = move >> 12 & 7
+    victim = mailbox[move >> 6 & 63]
+    if victim != NO_PIECE:
+        score += 100 + 10 * (victim % 6 + 1) - (mailbox[move & 63] % 6 + 1)
+    elif move >> 15 == FLAG_EN_PASSANT:
+        score += 100 + 10 - 1
+    return score
+
+
+@njit(cache=True)
+def negamax(bitboards: np.ndarray, mailboxes: np.ndarray, states: np.ndarray, moves: np.ndarray, scores: np.ndarray,
+            pv: np.ndarray, pv_lengths: np.ndarray, tables: np.ndarray, ply: int, depth: int, alpha: int,
+            beta: int) -> int:
+    """Alpha-beta search of the position at `ply` to `depth`, returns the score from the perspective of the side to move
+
+    The principal variation from the root is left in ``pv[ply, :pv_lengths[ply]]``. Like in :class:`AlphaBetaSearcher`,
+    being mated in `n` plies from the root scores :data:`MATE_SCORE` less `n` and a draw scores zero."""
+    pv_lengths[ply] = ply
+    us = states[ply, SIDE_TO_MOVE]
+
+    if depth <= 0:
+        score = evaluate(mailboxes[ply], tables)
+        return score if us == WHITE else -score
+
+    if is_insufficient_material(bitboards[ply]):
+        return 0
+
+    count = generate_moves(bitboards[ply], mailboxes[ply], states[ply], moves[ply])
+    for index in range(count):
+        scores[ply, index] = _move_order_score(mailboxes[ply], moves[ply, index])
+
+    best_score = -(MATE_SCORE - ply)
+    legal_moves = 0
+
+    for index in range(count):
+        # selection sort, since a cutoff often makes sorting the remaining moves unnecessary
+        best_index = index
+        for other in range(index + 1, count):
+            if scores[ply, other] > scores[ply, best_index]:
+                best_index = other
+        move = moves[ply, best_index]
+        moves[ply, best_index], scores[ply, best_index] = moves[ply, index], scores[ply, index]
+        moves[ply, index], scores[ply, index] = move, 0
+
+        make_move(bitboards, mailboxes, states, ply, move)
+        if _king_in_check(bitboards[ply + 1], mailboxes[ply + 1], states[ply + 1], us):
+            continue
+        legal_moves += 1
+
+        score = -negamax(bitboards, mailboxes, states, moves, scores, pv, pv_lengths, tables, ply + 1, depth - 1,
+                         -beta, -alpha)
+
+        if score > best_score:
+            best_score = score
+            pv[ply, ply] = move
+            pv[ply, ply + 1:pv_lengths[ply + 1]] = pv[ply + 1, ply + 1:pv_lengths[ply + 1]]
+            pv_lengths[ply] = pv_lengths[ply + 1]
+
+        if best_score > alpha:
+            alpha = best_score
+        if alpha >= beta:
+            break
+
+    if legal_moves == 0:
+        pv_lengths[ply] = ply
+        if _king_in_check(bitboards[ply], mailboxes[ply], states[ply], us):
+            return -(MATE_SCORE - ply)
+        return 0
+
+    return best_score
+
+
+@njit(cache=True)
+def perft(bitboards: np.ndarray, mailboxes: np.ndarray, states: np.ndarray, moves: np.ndarray, ply: int,
+          depth: int) -> int:
+    """Counts the leaf nodes of the tree of legal moves to `depth`, to check the move generator"""
+    if depth == 0:
+        return 1
+
+    us = states[ply, SIDE_TO_MOVE]
+    count = generate_moves(bitboards[ply], mailboxes[ply], states[ply], moves[ply])
+    nodes = 0
+    for index in range(count):
+        make_move(bitboards, mailboxes, states, ply, moves[ply, index])
+        if not _king_in_check(bitboards[ply + 1], mailboxes[ply + 1], states[ply + 1], us):
+            nodes += perft(bitboards, mailboxes, states, moves, ply + 1, depth - 1)
+    return nodes
@@ -6,6 +6,14 @@ from typing import Self
 import chess
 
 
+MATE_SCORE = 1_000_000
+"""Effective score of a mate on the board, mates in `n` plies score `n` less, so that shorter mates are preferred."""
+
+INFINITE_SCORE = 1_000_000_000
+"""Bound beyond every effective score, including mates, that opens an alpha-beta window to all scores. Scores are whole
+centi pawns throughout, so the bounds are integers as well rather than infinite floats."""
+
+
 class SearchResultType(Enum):
     """What type of result the searcher has found"""
     SCORE = auto()
@@ -16,26 +24,57 @@ class SearchResultType(Enum):
     """The search ends in a draw."""
 
 
-# pylint: disable=attribute-defined-outside-init
+# pylint: disable=too-few-public-methods
+class Variation:
+    """Sequence of moves as a linked list of a move and the variation after it, `None` being the empty variation
+
+    The searchers build the moves of their results from the leaves towards the root, and prepending a move to a linked
+    list neither copies the moves after it nor the moves before it. Only the result that the search returns in the end
+    is converted to a list, see :meth:`to_list`."""
+
+    __slots__ = ("move", "tail")
+
+    def __init__(self, move: chess.Move, tail: "Variation | None"):
+        self.move = move
+        self.tail = tail
+
+    @staticmethod
+    def to_list(variation: "Variation | None") -> list[chess.Move]:
+        """Collects the moves of `variation` into a list"""
+        moves = []
+        while variation is not None:
+            moves.append(variation.move)
+            variation = variation.tail
+        return moves
+
+
+_FACTORY_TOKEN = object()
+
+
 @total_ordering
 class SearchResult:
     """Result of a search into the move tree.
 
     This class cannot be instantiated directly but is constructed in the factory methods :meth:`from_score` and
-    :meth:`from_mate`, depending on the :class:`SearchResultType` of the result.
+    :meth:`from_mate`, depending on the :class:`SearchResultType` of the result. The searchers create one at every node,
+    so the attributes live in slots rather than an instance dictionary, and the factory methods pass all of them to the
+    constructor in one call. Searchers that keep a pool of results instead overwrite them in place with
+    :meth:`set_score`, :meth:`set_mate` and :meth:`copy_from`.
     """
 
-    def __init__(self):
-        # put those here so IDE/linter recognize them
-        self.moves: list[chess.Move] = []
-        self.score: float | None = None
-        self.type: SearchResultType | None = None
-        self.winner: bool | None = None
+    __slots__ = ("moves", "score", "type", "winner", "effective_score")
 
-        raise TypeError("SearchResult cannot be instantiated directly, use factory methods")
+    # pylint: disable=too-many-arguments,redefined-builtin
+    def __init__(self, type: SearchResultType, moves: list[chess.Move], score: int | None, winner: bool | None,
+                 effective_score: int, token: object = None):
+        if token is not _FACTORY_TOKEN:
+            raise TypeError("SearchResult cannot be instantiated directly, use factory methods")
 
-    def __new__(cls):
-        return super().__new__(cls)
+        self.type = type
+        self.moves = moves
+        self.score = score
+        self.winner = winner
+        self.effective_score = effective_score
 
     def __eq__(self, other: Self) -> bool:
         assert isinstance(other, self.__class__)
@@ -45,7 +84,7 @@ class SearchResult:
             if len(self.moves) != len(other.moves):
                 return False
 
-        return self.get_effective_score() == other.get_effective_score()
+        return self.effective_score == other.effective_score
 
     def __lt__(self, other: Self) -> bool:
         assert isinstance(other, self.__class__)
@@ -58,48 +97,59 @@ class SearchResult:
                 else:
                     return len(self.moves) < len(other.moves)
 
-        return self.get_effective_score() < other.get_effective_score()
-
-    def get_effective_score(self) -> float:
-        """Get a score value for a result. Positive or negative infinity for mate and zero for draw."""
-        if self.type == SearchResultType.SCORE:
-            return self.score
-        elif self.type == SearchResultType.MATE:
-            return float("inf") if self.winner == chess.WHITE else float("-inf")
-        else:
-            return 0.0
+        return self.effective_score < other.effective_score
+
+    def get_effective_score(self) -> int:
+        """Get a score value for a result. Plus or minus :data:`MATE_SCORE` less the number of moves for mate and zero
+        for draw.
+
+        The score is computed once in the factory methods and also available as :attr:`effective_score`, which the
+        searchers read at every node."""
+        return self.effective_score
+
+    def set_score(self, score: int, moves: list[chess.Move]) -> None:
+        """Turns the result in place into one that represents a regular evaluation score, like :meth:`from_score`"""
+        self.type = SearchResultType.SCORE
+        self.moves = moves
+        self.score = score
+        self.winner = None
+        self.effective_score = score
+
+    def set_mate(self, winner: bool, moves: list[chess.Move], plies: int | None = None) -> None:
+        """Turns the result in place into one that represents forced mate, like :meth:`from_mate`"""
+        distance = MATE_SCORE - (len(moves) if plies is None else plies)
+        self.type = SearchResultType.MATE
+        self.moves = moves
+        self.score = None
+        self.winner = winner
+        self.effective_score = distance if winner == chess.WHITE else -distance
+
+    def copy_from(self, other: Self) -> None:
+        """Overwrites all attributes with those of `other`"""
+        self.type = other.type
+        self.moves = other.moves
+        self.score = other.score
+        self.winner = other.winner
+        self.effective_score = other.effective_score
 
     @classmethod
-    def from_score(cls, score: float, moves: list[chess.Move]) -> Self:
+    def from_score(cls, score: int, moves: list[chess.Move]) -> Self:
         """Create a search result that represents a regular evaluation score."""
-
-        instance = cls.__new__(cls)
-        instance.type = SearchResultType.SCORE
-        instance.moves = moves
-        instance.score = score
-
-        return instance
+        return cls(SearchResultType.SCORE, moves, score, None, score, _FACTORY_TOKEN)
 
     @classmethod
-    def from_mate(cls, winner: bool, moves: list[chess.Move]) -> Self:
-        """Create a search result that represents forced mate in a certain number of moves."""
-
-        instance = cls.__new__(cls)
-        instance.type = SearchResultType.MATE
-        instance.moves = moves
-        instance.winner = winner
+    def from_mate(cls, winner: bool, moves: list[chess.Move], plies: int | None = None) -> Self:
+        """Create a search result that represents forced mate in a certain number of moves.
 
-        return instance
+        `plies` is the number of plies until mate, which defaults to the number of `moves`."""
+        distance = MATE_SCORE - (len(moves) if plies is None else plies)
+        return cls(SearchResultType.MATE, moves, None, winner, distance if winner == chess.WHITE else -distance,
+                   _FACTORY_TOKEN)
 
     @classmethod
     def from_draw(cls, moves: list[chess.Move]) -> Self:
-        """Create a search result that represents forced mate in a certain number of moves."""
-
-        instance = cls.__new__(cls)
-        instance.type = SearchResultType.DRAW
-        instance.moves = moves
-
-        return instance
+        """Create a search result that represents a draw."""
+        return cls(SearchResultType.DRAW, moves, None, None, 0, _FACTORY_TOKEN)
 
 
 # pylint: disable=too-few-public-methods
@@ -107,5 +157,6 @@ class Searcher(ABC):
     """Search algorithm that provides an evaluation of a chess position based on searching in the tree of
     possible moves"""
     @abstractmethod
-    def search(self, board: chess.Board) -> float:
-        """Performs the tree search and returns an evaluation in centi pawns"""
+    def search(self, board: chess.Board) -> SearchResult:
+        """Performs the tree search and returns its result, including the evaluation in centi pawns and the principal
+        variation starting with the best move"""
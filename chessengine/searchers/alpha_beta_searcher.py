@@ -1,24 +1,58 @@
+from typing import Callable
+
 import chess
 
+from ..cache import ChessCache, EvaluationCache, NodeType
 from ..evaluators import Evaluator
+from ..zobrist import HashedBoard
 
-from .abstract import Searcher, SearchResult
+from .abstract import INFINITE_SCORE, MATE_SCORE, Searcher, SearchResult, SearchResultType, Variation
+from .move_ordering import history_index, is_quiet, sort_moves
 
 
 class AlphaBetaSearcher(Searcher):
-    """Searcher based on Alpha-Beta Pruning"""
+    """Searcher based on Alpha-Beta Pruning
+
+    If a `cachesize` is given, the searcher keeps a transposition table of that many entries. It then deepens the search
+    iteratively and searches the principal variation of the previous iteration first, and the cached best moves
+    elsewhere, which leads to earlier cutoffs. Each iteration starts out with an aspiration window of
+    :attr:`ASPIRATION_WINDOW` around the score of the previous iteration, which is widened if the score falls outside.
+    Static evaluations at the leaves are cached separately in an :class:`EvaluationCache` of the same size.
+
+    Quiet moves that cause a cutoff are remembered as killer moves of their ply and counted in a history table, both of
+    which are used to order the quiet moves of later nodes.
+
+    With `quiescence`, the leaves aren't evaluated statically but searched further along captures only, until the
+    position is quiet, so that the search doesn't stop in the middle of an exchange. This usually makes up for a ply
+    less of full-width search."""
 
-    def __init__(self, evaluator: Evaluator, depth: int):
+    ASPIRATION_WINDOW = 50
+    """Half the width of the window around the score of the previous iteration, in centi pawns"""
+
+    def __init__(self, evaluator: Evaluator, depth: int, cachesize: int | None = None, quiescence: bool = False):
         assert depth >= 0
 
         self.evaluator: Evaluator = evaluator
         self.depth: int = depth
+        self.quiescence: bool = quiescence
+        self._eval: Callable[[chess.Board], int] | None = None
 
         self.board: chess.Board | None = None
         self.move_count_at_search_begin: int | None = None
 
-        self.alpha: float = 0.0
-        self.beta: float = 0.0
+        self.alpha: int = 0
+        self.beta: int = 0
+        self.principal_variation: list[chess.Move] = []
+        self.killers: list[list[chess.Move | None]] = []
+        self.history: list[int] = []
+        self._iteration_depth: int = 0
+        self._results: list[SearchResult] = []
+
+        self.cache: ChessCache | None = None
+        self.eval_cache: EvaluationCache | None = None
+        if cachesize is not None:
+            self.cache = ChessCache(cachesize)
+            self.eval_cache = EvaluationCache(cachesize)
 
     def get_search_move_stack(self) -> list[chess.Move]:
         """Get the list of moves the leads to the current node in the search"""
@@ -26,54 +60,241 @@ class AlphaBetaSearcher(Searcher):
 
     def init_search(self, board: chess.Board) -> None:
         """Initialize internal variables of the `Searcher` for search begin"""
+        # the cache needs the incrementally maintained Zobrist hash of a hashed board
+        if self.cache is not None and not isinstance(board, HashedBoard):
+            board = HashedBoard(board.fen(), chess960=board.chess960)
+
         self.board = board
         self.move_count_at_search_begin = len(board.move_stack)
-        self.alpha = float("-inf")
-        self.beta = float("inf")
+        # bound once per search rather than looked up on the evaluator at every leaf
+        self._eval = self.evaluator.eval
+        self.alpha = -INFINITE_SCORE
+        self.beta = INFINITE_SCORE
+        self.killers = [[None, None] for _ in range(self.depth + 1)]
+        self.history = [0] * (2 * 7 * 64)
+        # one result per ply that the nodes of that ply return, overwritten rather than created anew at every node, so
+        # the pool is replaced for every search to not overwrite the result of the previous one
+        self._results = [SearchResult.from_draw(None) for _ in range(self.depth + 1)]
 
     def search(self, board: chess.Board) -> SearchResult:
         self.init_search(board)
-        search_result = self._alpha_beta(self.depth, self.alpha, self.beta)
+        color = 1 if board.turn == chess.WHITE else -1
+
+        # iterative deepening only pays off if the cache carries the best moves from one iteration to the next, the
+        # principal variation of the previous iteration is searched first in any case
+        depths = [self.depth]
+        if self.cache is not None and self.depth > 0:
+            depths = range(1, self.depth + 1)
+
+        self.principal_variation = []
+        search_result = None
+        for depth in depths:
+            self._iteration_depth = depth
+            search_result = self._aspiration_search(depth, color, search_result)
+            search_result.moves = Variation.to_list(search_result.moves)
+            self.principal_variation = search_result.moves
+
         return search_result
 
-    def _alpha_beta(self, depth: int, alpha: float, beta: float) -> SearchResult:
-        anchor = self._check_recursion_anchors(depth)
+    def _aspiration_search(self, depth: int, color: int, previous_result: SearchResult | None) -> SearchResult:
+        # search in a narrow window around the score of the previous iteration, which cuts off more than the full
+        # window, and widen the side that the score falls out of until the score lies inside
+        alpha, beta = self.alpha, self.beta
+        if previous_result is None or previous_result.type == SearchResultType.MATE:
+            return self._negamax(depth, alpha, beta, color)
+
+        previous_score = color * previous_result.effective_score
+        delta = self.ASPIRATION_WINDOW
+        alpha, beta = previous_score - delta, previous_score + delta
+
+        while True:
+            search_result = self._negamax(depth, alpha, beta, color)
+            score = color * search_result.effective_score
+
+            if score <= alpha:
+                alpha = score - delta if abs(score) < MATE_SCORE // 2 else self.alpha
+            elif score >= beta:
+                beta = score + delta if abs(score) < MATE_SCORE // 2 else self.beta
+            else:
+                return search_result
+
+            delta *= 2
+
+    def _negamax(self, depth: int, alpha: int, beta: int, color: int) -> SearchResult:
+        # alpha and beta bound the score from the perspective of the side to move, `color` is 1 if that is white and -1
+        # otherwise, the returned result is always from white's perspective and its moves are the `Variation` from the
+        # current node on, valid until the next node of the same ply is searched
+        ply = self._iteration_depth - depth
+        if depth <= 0 and self.quiescence:
+            return self._score_result(ply, color * self._quiescence_search(alpha, beta, color))
+
+        anchor = self._check_recursion_anchors(depth, ply)
         if anchor is not None:
             return anchor
 
-        return self._recurse(depth, alpha, beta)
+        cached_move = None
+        cache = self.cache
+        if cache is not None:
+            entry = cache.get_entry(self.board.key)
+
+            if entry is not None:
+                cached_move = entry.best_move
+
+                # a deep enough entry is either the exact value or bounds it, which may be enough for a cutoff, except
+                # at the root, which has to be searched to find a move
+                if entry.depth >= depth and ply > 0:
+                    if entry.node_type == NodeType.EXACT:
+                        return self._score_result(ply, color * entry.value)
+                    if entry.node_type == NodeType.LOWER_BOUND:
+                        if entry.value > alpha:
+                            alpha = entry.value
+                    elif entry.value < beta:
+                        beta = entry.value
+                    if alpha >= beta:
+                        return self._score_result(ply, color * entry.value)
 
-    def _check_recursion_anchors(self, depth: int) -> SearchResult | None:
+        return self._recurse(depth, ply, alpha, beta, color, cached_move)
+
+    def _check_recursion_anchors(self, depth: int, ply: int) -> SearchResult | None:
         # if one of the conditions to break the Alpha-Beta recursion is met, return the final value
 
         if depth <= 0:
-            return SearchResult.from_score(self.evaluator.eval(self.board), self.get_search_move_stack())
-
-        if self.board.is_checkmate():
-            return SearchResult.from_mate(chess.BLACK if self.board.turn == chess.WHITE else chess.WHITE,
-                                          self.get_search_move_stack())
-
-        if self.board.is_stalemate() or self.board.is_insufficient_material():
-            return SearchResult.from_draw(self.get_search_move_stack())
-
-    def _recurse(self, depth: int, alpha: float, beta: float) -> SearchResult:
-        maximize = self.board.turn == chess.WHITE
-        best_result = SearchResult.from_mate(chess.BLACK if self.board.turn == chess.WHITE else chess.WHITE,
-                                             self.get_search_move_stack())
-        selector = max if maximize else min
-
-        for move in self.board.legal_moves:
-            self.board.push(move)
-            best_result = selector(best_result, self._alpha_beta(depth - 1, alpha, beta))
-            self.board.pop()
-
-            if maximize:
-                alpha = max(alpha, best_result.get_effective_score())
-                if alpha >= beta:
-                    break
-            else:
-                beta = min(beta, best_result.get_effective_score())
-                if beta <= alpha:
-                    break
+            return self._score_result(ply, self._evaluate())
+
+        # checkmate and stalemate are detected from the generated moves in the recursion
+        if self.board.is_insufficient_material():
+            return SearchResult.from_draw(None)
+
+    def _game_over_result(self, ply: int) -> SearchResult:
+        # result for a board without legal moves, which is mate if the side to move is in check and stalemate otherwise
+        if self.board.is_check():
+            return SearchResult.from_mate(not self.board.turn, None, ply)
+
+        return SearchResult.from_draw(None)
+
+    def _score_result(self, ply: int, score: int) -> SearchResult:
+        # the pooled result of `ply` set to a regular evaluation score
+        result = self._results[ply]
+        result.set_score(score, None)
+        return result
 
+    def _evaluate(self) -> int:
+        # static evaluation of the current board, looked up in the evaluation cache if there is one
+        board, eval_cache = self.board, self.eval_cache
+        if eval_cache is None:
+            return self._eval(board)
+
+        key = board.key
+        value = eval_cache.get(key)
+        if value is None:
+            value = self._eval(board)
+            eval_cache.insert(key, value)
+
+        return value
+
+    def _quiescence_search(self, alpha: int, beta: int, color: int) -> int:
+        # score of the current board from the perspective of the side to move, who may either stand pat on the static
+        # evaluation or capture
+        best_score = color * self._evaluate()
+        if best_score >= beta:
+            return best_score
+        if best_score > alpha:
+            alpha = best_score
+
+        board = self.board
+        captures = list(board.generate_legal_captures())
+        sort_moves(board, captures)
+
+        push, pop, quiescence_search = board.push, board.pop, self._quiescence_search
+        for move in captures:
+            push(move)
+            score = -quiescence_search(-beta, -alpha, -color)
+            pop()
+
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        return best_score
+
+    def _recurse(self, depth: int, ply: int, alpha: int, beta: int, color: int,
+                 cached_move: chess.Move | None = None) -> SearchResult:
+        board = self.board
+        moves = list(board.generate_legal_moves())
+        if not moves:
+            return self._game_over_result(ply)
+
+        # the results of the children are copied into the pooled result of this ply, which they don't use themselves
+        best_result = self._results[ply]
+        best_result.set_mate(not board.turn, None, ply)
+        best_score = color * best_result.effective_score
+        best_move = None
+        alpha_at_entry = alpha
+
+        sort_moves(board, moves, self._get_principal_variation_move(ply) or cached_move, self.killers[ply],
+                   self.history)
+
+        # bound methods in locals rather than looked up for every move
+        push, pop, negamax, copy_result = board.push, board.pop, self._negamax, best_result.copy_from
+        for move in moves:
+            push(move)
+            result = negamax(depth - 1, -beta, -alpha, -color)
+            pop()
+
+            score = color * result.effective_score
+            # the window can only narrow and cut off when the best score improves, alpha starts out below beta
+            if score > best_score:
+                copy_result(result)
+                best_score, best_move = score, move
+
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if is_quiet(board, move):
+                            self._update_killers_and_history(ply, depth, move)
+                        break
+
+        if self.cache is not None:
+            self._store(depth, alpha_at_entry, beta, best_result, best_score, best_move)
+
+        best_result.moves = Variation(best_move, best_result.moves)
         return best_result
+
+    def _update_killers_and_history(self, ply: int, depth: int, move: chess.Move) -> None:
+        # remember a quiet move that caused a cutoff, deeper searches weigh more in the history
+        killers = self.killers[ply]
+        if move != killers[0]:
+            killers[1] = killers[0]
+            killers[0] = move
+
+        self.history[history_index(self.board, move)] += depth * depth
+
+    def _get_principal_variation_move(self, ply: int) -> chess.Move | None:
+        # the move of the previous iteration's principal variation, if the current node at `ply` lies on it
+        principal_variation = self.principal_variation
+
+        if ply < len(principal_variation) and self.get_search_move_stack() == principal_variation[:ply]:
+            return principal_variation[ply]
+
+        return None
+
+    def _store(self, depth: int, alpha: int, beta: int, result: SearchResult, score: int,
+               best_move: chess.Move | None) -> None:
+        # values are cached from the perspective of the side to move, like alpha and beta
+
+        # mates are not cached, because the cache can't restore the number of moves until mate, which the search relies
+        # on to prefer shorter mates
+        if result.type == SearchResultType.MATE:
+            return
+
+        if score <= alpha:
+            node_type = NodeType.UPPER_BOUND
+        elif score >= beta:
+            node_type = NodeType.LOWER_BOUND
+        else:
+            node_type = NodeType.EXACT
+
+        self.cache.insert_or_update(self.board.key, depth, score, best_move, node_type)
@@ -1,7 +1,9 @@
+from typing import Callable
+
 import chess
 
 from ..evaluators import Evaluator
-from .abstract import Searcher, SearchResult
+from .abstract import Searcher, SearchResult, Variation
 
 
 class MinimaxSearcher(Searcher):
@@ -12,6 +14,8 @@ class MinimaxSearcher(Searcher):
 
         self.evaluator = evaluator
         self.depth = depth
+        self._eval: Callable[[chess.Board], int] | None = None
+        self._batch_frontier: bool = False
 
         self.board: chess.Board | None = None
         self.move_count_at_search_begin: int | None = None
@@ -24,41 +28,84 @@ class MinimaxSearcher(Searcher):
         """Initialize internal variables of the `Searcher` for search begin"""
         self.board = board
         self.move_count_at_search_begin = len(board.move_stack)
+        self._eval = self.evaluator.eval
+        # only evaluators with a vectorized batch evaluation make up for copying the leaf positions
+        self._batch_frontier = type(self.evaluator).eval_batch is not Evaluator.eval_batch
 
     def search(self, board: chess.Board) -> SearchResult:
         self.init_search(board)
-        search_result = self._minimax(self.depth)
+        search_result = self._negamax(self.depth, 1 if board.turn == chess.WHITE else -1)
+        search_result.moves = Variation.to_list(search_result.moves)
 
         return search_result
 
-    def _minimax(self, depth: int) -> SearchResult:
+    def _negamax(self, depth: int, color: int) -> SearchResult:
+        # `color` is 1 if white is to move and -1 otherwise, the returned result is always from white's perspective and
+        # its moves are the `Variation` from the current node on
         anchor = self._check_recursion_anchors(depth)
         if anchor is not None:
             return anchor
 
-        return self._recurse_minimax(depth)
+        return self._recurse_negamax(depth, color)
 
     def _check_recursion_anchors(self, depth: int) -> SearchResult | None:
         # if one of the conditions to break the Minimax recursion is met, return the final value
 
         if depth <= 0:
-            return SearchResult.from_score(self.evaluator.eval(self.board), self.get_search_move_stack())
+            return SearchResult.from_score(self._eval(self.board), None)
+
+        # checkmate and stalemate are detected from the generated moves in the recursion
+        if self.board.is_insufficient_material():
+            return SearchResult.from_draw(None)
+
+    def _game_over_result(self, ply: int) -> SearchResult:
+        # result for a board without legal moves, which is mate if the side to move is in check and stalemate otherwise
+        if self.board.is_check():
+            return SearchResult.from_mate(not self.board.turn, None, ply)
+
+        return SearchResult.from_draw(None)
+
+    def _recurse_negamax(self, depth: int, color: int) -> SearchResult:
+        board = self.board
+        ply = len(board.move_stack) - self.move_count_at_search_begin
 
-        if self.board.is_checkmate():
-            return SearchResult.from_mate(chess.BLACK if self.board.turn == chess.WHITE else chess.WHITE,
-                                          self.get_search_move_stack())
+        # generate the moves up front rather than lazily while the board changes underneath
+        moves = list(board.generate_legal_moves())
+        if not moves:
+            return self._game_over_result(ply)
 
-        if self.board.is_stalemate() or self.board.is_insufficient_material():
-            return SearchResult.from_draw(self.get_search_move_stack())
+        if depth == 1 and self._batch_frontier:
+            return self._evaluate_frontier(moves, color)
 
-    def _recurse_minimax(self, depth: int):
-        best_result = SearchResult.from_mate(chess.BLACK if self.board.turn == chess.WHITE else chess.WHITE,
-                                             self.get_search_move_stack())
-        selector = max if self.board.turn == chess.WHITE else min
+        best_result = SearchResult.from_mate(not board.turn, None, ply)
+        best_score = color * best_result.effective_score
+        best_move = None
 
-        for move in self.board.legal_moves:
-            self.board.push(move)
-            best_result = selector(best_result, self._minimax(depth - 1))
-            self.board.pop()
+        push, pop, negamax = board.push, board.pop, self._negamax
+        for move in moves:
+            push(move)
+            result = negamax(depth - 1, -color)
+            pop()
 
+            score = color * result.effective_score
+            if score > best_score:
+                best_result, best_score, best_move = result, score, move
+
+        # the result is passed up only once, so its moves can be extended in place
+        best_result.moves = Variation(best_move, best_result.moves)
         return best_result
+
+    def _evaluate_frontier(self, moves: list[chess.Move], color: int) -> SearchResult:
+        # the children of a node at depth 1 are all leaves, which minimax evaluates without exception, so they are
+        # evaluated in a single batch from copies of the positions without their move stacks
+        board = self.board
+        children = []
+        for move in moves:
+            board.push(move)
+            children.append(board.copy(stack=False))
+            board.pop()
+
+        scores = self.evaluator.eval_batch(children).tolist()
+        best_index = max(range(len(moves)), key=lambda index: color * scores[index])
+
+        return SearchResult.from_score(scores[best_index], Variation(moves[best_index], None))
@@ -0,0 +1,74 @@
+"""Heuristics to order moves so that alpha-beta pruning cuts off early"""
+
+from typing import Iterable, Sequence
+
+import chess
+from chess import BB_SQUARES
+
+BEST_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 29
+KILLER_SCORE = 1 << 28
+
+
+def _move_code(move: chess.Move) -> int:
+    # from square, to square and promotion piece packed into an integer
+    return move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+
+
+def history_index(board: chess.Board, move: chess.Move) -> int:
+    """Index of `move` of `board` into a history table of ``2 * 7 * 64`` counters, by color and type of the moving piece
+    and target square"""
+    return (7 * board.turn + board.piece_type_at(move.from_square)) << 6 | move.to_square
+
+
+def is_quiet(board: chess.Board, move: chess.Move) -> bool:
+    """Whether `move` of `board` is neither a capture nor a promotion"""
+    return not move.promotion and not board.is_capture(move)
+
+
+def order_moves(board: chess.Board, moves: Iterable[chess.Move], best_move: chess.Move | None = None,
+                killers: Sequence[chess.Move | None] = (), history: Sequence[int] | None = None) -> list[chess.Move]:
+    """Returns `moves` of `board` in the order they should be searched in, see :func:`sort_moves`"""
+    moves = list(moves)
+    sort_moves(board, moves, best_move, killers, history)
+    return moves
+
+
+def sort_moves(board: chess.Board, moves: list[chess.Move], best_move: chess.Move | None = None,
+               killers: Sequence[chess.Move | None] = (), history: Sequence[int] | None = None) -> None:
+    """Sorts the list of `moves` of `board` in place into the order they should be searched in.
+
+    `best_move`, e.g. the best move of an earlier search, comes first. Captures and promotions follow, ordered by most
+    valuable victim and then least valuable attacker (MVV-LVA), and by the promoted piece. Next come the `killers`,
+    quiet moves that caused a cutoff in a sibling node, in the given order. The remaining moves are ordered by their
+    counters in the `history` table, see :func:`history_index`, or keep their order without one."""
+    opponent = board.occupied_co[not board.turn]
+    pawns, ep_square, piece_type_at = board.pawns, board.ep_square, board.piece_type_at
+    history_offset = 7 * board.turn
+
+    # moves are compared by their codes, since comparing and hashing the move objects themselves is a lot slower
+    best_code = _move_code(best_move) if best_move else -1
+    killer_scores = {_move_code(killer): KILLER_SCORE + len(killers) - index
+                     for index, killer in enumerate(killers) if killer}
+
+    def score(move: chess.Move) -> int:
+        from_square, to_square, promotion = move.from_square, move.to_square, move.promotion
+        code = from_square | to_square << 6 | (promotion or 0) << 12
+        if code == best_code:
+            return BEST_MOVE_SCORE
+
+        if opponent & BB_SQUARES[to_square]:
+            return CAPTURE_SCORE + 10 * piece_type_at(to_square) - piece_type_at(from_square) + (promotion or 0)
+        if to_square == ep_square and pawns & BB_SQUARES[from_square]:
+            return CAPTURE_SCORE + 10 * chess.PAWN - chess.PAWN
+        if promotion:
+            return CAPTURE_SCORE + promotion
+
+        if code in killer_scores:
+            return killer_scores[code]
+
+        if history is None:
+            return 0
+        return history[(history_offset + piece_type_at(from_square)) << 6 | to_square]
+
+    moves.sort(key=score, reverse=True)
@@ -0,0 +1,80 @@
+import chess
+import numpy as np
+
+from ..evaluators import SimpleHandCraftedEvaluator
+from . import _numba_search as kernel
+from .abstract import MATE_SCORE, Searcher, SearchResult
+
+
+class NumbaAlphaBetaSearcher(Searcher):
+    """Searcher based on Alpha-Beta Pruning that runs entirely in a Numba-compiled kernel
+
+    The kernel has its own move generator and evaluates leaves with the piece-square tables of a
+    :class:`SimpleHandCraftedEvaluator`, so it finds the same scores as an :class:`AlphaBetaSearcher` with that
+    evaluator and no cache, including draws by insufficient material, only without the overhead of python-chess at
+    every node. Only the conversion of the board and of the principal variation happens in Python. Chess960 isn't
+    supported."""
+
+    def __init__(self, evaluator: SimpleHandCraftedEvaluator, depth: int):
+        assert depth >= 0
+        assert isinstance(evaluator, SimpleHandCraftedEvaluator)
+
+        self.evaluator = evaluator
+        self.depth = depth
+        # pylint: disable=protected-access
+        self._tables = np.array(evaluator._tables, dtype=np.int64)
+
+        # one slot per ply, the search makes the moves of ply `n` in slot `n + 1`
+        plies = depth + 2
+        self._bitboards = np.zeros((plies, 2, 6), dtype=np.uint64)
+        self._mailboxes = np.full((plies, 64), kernel.NO_PIECE, dtype=np.int8)
+        self._states = np.zeros((plies, kernel.STATE_SIZE), dtype=np.int64)
+        self._moves = np.zeros((plies, kernel.MAX_MOVES), dtype=np.int64)
+        self._scores = np.zeros((plies, kernel.MAX_MOVES), dtype=np.int64)
+        self._pv = np.zeros((plies, plies), dtype=np.int64)
+        self._pv_lengths = np.zeros(plies, dtype=np.int64)
+
+    def set_up(self, board: chess.Board) -> None:
+        """Writes `board` into the root slot of the kernel's position arrays"""
+        # the kernel castles the king from e1 or e8 only
+        assert not board.chess960
+        bitboards, mailbox, state = self._bitboards[0], self._mailboxes[0], self._states[0]
+        bitboards[:] = 0
+        mailbox[:] = kernel.NO_PIECE
+
+        for square, piece in board.piece_map().items():
+            bitboards[int(piece.color), piece.piece_type - 1] |= np.uint64(chess.BB_SQUARES[square])
+            mailbox[square] = 6 * int(piece.color) + piece.piece_type - 1
+
+        castling = board.clean_castling_rights()
+        state[kernel.SIDE_TO_MOVE] = int(board.turn)
+        state[kernel.CASTLING] = (kernel.WHITE_KINGSIDE * bool(castling & chess.BB_H1)
+                                  | kernel.WHITE_QUEENSIDE * bool(castling & chess.BB_A1)
+                                  | kernel.BLACK_KINGSIDE * bool(castling & chess.BB_H8)
+                                  | kernel.BLACK_QUEENSIDE * bool(castling & chess.BB_A8))
+        state[kernel.EP_SQUARE] = kernel.NO_SQUARE if board.ep_square is None else board.ep_square
+        state[kernel.BLACK_KING] = board.king(chess.BLACK)
+        state[kernel.WHITE_KING] = board.king(chess.WHITE)
+
+    def search(self, board: chess.Board) -> SearchResult:
+        self.set_up(board)
+        score = kernel.negamax(self._bitboards, self._mailboxes, self._states, self._moves, self._scores, self._pv,
+                               self._pv_lengths, self._tables, 0, self.depth, -kernel.INFINITY, kernel.INFINITY)
+
+        moves = [_decode_move(int(code)) for code in self._pv[0, :self._pv_lengths[0]]]
+        if board.turn == chess.BLACK:
+            score = -score
+
+        if abs(score) == MATE_SCORE - len(moves):
+            return SearchResult.from_mate(chess.WHITE if score > 0 else chess.BLACK, moves)
+
+        # only the principal variations of games that end in a draw stop short of the search depth
+        if len(moves) < self.depth:
+            return SearchResult.from_draw(moves)
+
+        return SearchResult.from_score(int(score), moves)
+
+
+def _decode_move(code: int) -> chess.Move:
+    promotion = code >> 12 & 7
+    return chess.Move(code & 63, code >> 6 & 63, promotion + 1 if promotion else None)
@@ -0,0 +1,174 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import multiprocessing
+import random
+
+import chess
+
+from ..cache import ChessCache, EvaluationCache
+from ..evaluators import Evaluator
+from .abstract import Searcher, SearchResult, SearchResultType
+from .alpha_beta_searcher import AlphaBetaSearcher
+
+
+class ParallelRootSearcher(Searcher):
+    """Searcher that distributes the moves at the root among a pool of processes
+
+    Each process gets a copy of `searcher`, which searches the position after one root move at a time. The search is
+    thereby one ply deeper than that of `searcher` alone. The processes don't share their alpha-beta windows or caches,
+    but the root moves are searched concurrently on separate cores, unhindered by the GIL."""
+
+    def __init__(self, searcher: Searcher, max_workers: int | None = None):
+        self.searcher = searcher
+        self.max_workers = max_workers
+
+    def search(self, board: chess.Board) -> SearchResult:
+        moves = list(board.generate_legal_moves())
+        if not moves:
+            return self.searcher.search(board)
+
+        # boards are sent to the workers as FEN, which is much cheaper to pickle than the board with its move stack
+        with ProcessPoolExecutor(self.max_workers, initializer=_init_worker, initargs=(self.searcher,)) as executor:
+            results = list(executor.map(_search_move, repeat(board.fen()), moves))
+
+        color = 1 if board.turn == chess.WHITE else -1
+        best_move, best_result = moves[0], results[0]
+        for move, result in zip(moves, results):
+            if color * result.effective_score > color * best_result.effective_score:
+                best_move, best_result = move, result
+
+        return _prepend_move(best_move, best_result)
+
+
+class LazySMPSearcher(Searcher):
+    """Searcher that runs several Alpha-Beta searches of the same position in a pool of processes, which share their
+    transposition table (Lazy SMP)
+
+    Every process runs an iteratively deepened :class:`AlphaBetaSearcher` with a :class:`ChessCache` of `cachesize`
+    entries in shared memory, so the processes profit from the entries of the others. The first process is the main
+    search to `depth`, whose result is returned. The others are helpers that fill the cache for the main search. They
+    are diversified by worker, so that they visit the tree in different orders: each one starts out with random
+    counters in its history table, and every other one searches one ply deeper. The helpers abort their searches as
+    soon as the main search is done.
+
+    The processes and the cache are created with the first search and kept for the following ones, until :meth:`close`
+    is called, which also happens on leaving the searcher as a context manager."""
+
+    def __init__(self, evaluator: Evaluator, depth: int, cachesize: int, max_workers: int | None = None):
+        assert depth >= 0
+
+        self.evaluator = evaluator
+        self.depth = depth
+        self.cachesize = cachesize
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+
+        self._pool = None
+        self._stop = None
+
+    def __enter__(self) -> "LazySMPSearcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def search(self, board: chess.Board) -> SearchResult:
+        if self._pool is None:
+            self._start_pool()
+
+        fen = board.fen()
+        self._stop.value = 0
+        results = [self._pool.apply_async(_search_to_depth, (fen, self.depth + worker % 2, worker))
+                   for worker in range(self.max_workers)]
+        result = results[0].get()
+
+        # the helpers must have aborted before the next search starts
+        self._stop.value = 1
+        for helper_result in results[1:]:
+            helper_result.wait()
+
+        return result
+
+    def close(self) -> None:
+        """Shuts down the processes of the searcher"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _start_pool(self) -> None:
+        buffer = multiprocessing.RawArray("b", ChessCache.buffer_size(self.cachesize))
+        ChessCache(self.cachesize, buffer).clear()
+        self._stop = multiprocessing.RawValue("b", 0)
+
+        self._pool = multiprocessing.Pool(self.max_workers, initializer=_init_lazy_smp_worker,
+                                          initargs=(self.evaluator, self.cachesize, buffer, self._stop))
+
+
+class _SearchAborted(Exception):
+    pass
+
+
+class _LazySMPWorkerSearcher(AlphaBetaSearcher):
+    # searcher of a Lazy SMP process, which runs the main search as worker zero and helper searches otherwise
+
+    def __init__(self, evaluator: Evaluator, cachesize: int, buffer, stop):
+        super().__init__(evaluator, 0)
+        self.cache = ChessCache(cachesize, buffer)
+        self.eval_cache = EvaluationCache(cachesize)
+        self.worker = 0
+        self._stop = stop
+
+    def init_search(self, board: chess.Board) -> None:
+        super().init_search(board)
+
+        # small random counters reorder the quiet moves of a helper until the counters of its search outweigh them
+        if self.worker:
+            rng = random.Random(self.worker)
+            self.history = [rng.randrange(8) for _ in self.history]
+
+    def _recurse(self, depth: int, ply: int, alpha: int, beta: int, color: int,
+                 cached_move: chess.Move | None = None) -> SearchResult:
+        if self.worker and self._stop.value:
+            raise _SearchAborted
+
+        return super()._recurse(depth, ply, alpha, beta, color, cached_move)
+
+
+_worker_searcher: Searcher | None = None
+
+
+def _init_worker(searcher: Searcher) -> None:
+    global _worker_searcher  # pylint: disable=global-statement
+    _worker_searcher = searcher
+
+
+def _search_move(fen: str, move: chess.Move) -> SearchResult:
+    board = chess.Board(fen)
+    board.push(move)
+    return _worker_searcher.search(board)
+
+
+def _init_lazy_smp_worker(evaluator: Evaluator, cachesize: int, buffer, stop) -> None:
+    global _worker_searcher  # pylint: disable=global-statement
+    _worker_searcher = _LazySMPWorkerSearcher(evaluator, cachesize, buffer, stop)
+
+
+def _search_to_depth(fen: str, depth: int, worker: int) -> SearchResult | None:
+    # the result of the search, or `None` for an aborted helper
+    _worker_searcher.depth = depth
+    _worker_searcher.worker = worker
+    try:
+        return _worker_searcher.search(chess.Board(fen))
+    except _SearchAborted:
+        return None
+
+
+def _prepend_move(move: chess.Move, result: SearchResult) -> SearchResult:
+    # the result of a search below `move`, as seen from the position before `move`
+    moves = [move] + result.moves
+
+    if result.type == SearchResultType.MATE:
+        return SearchResult.from_mate(result.winner, moves)
+    if result.type == SearchResultType.DRAW:
+        return SearchResult.from_draw(moves)
+    return SearchResult.from_score(result.score, moves)
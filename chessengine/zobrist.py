@@ -0,0 +1,175 @@
+"""Zobrist hashing of chess positions"""
+
+from typing import Callable
+
+import chess
+import chess.polyglot
+from chess.polyglot import POLYGLOT_RANDOM_ARRAY
+
+PIECE_SQUARE_OFFSET = 0
+CASTLING_OFFSET = 768
+EN_PASSANT_OFFSET = 772
+TURN_OFFSET = 780
+
+# rook squares of the castling rights in the order of the Polyglot random numbers
+CASTLING_SQUARES = (chess.H1, chess.A1, chess.H8, chess.A8)
+CASTLING_CORNERS = chess.BB_H1 | chess.BB_A1 | chess.BB_H8 | chess.BB_A8
+
+
+class HashedBoard(chess.Board):
+    """Board that maintains its Zobrist hash incrementally while moves are pushed and popped.
+
+    The random numbers are the Polyglot constants, so :attr:`key` agrees with :func:`chess.polyglot.zobrist_hash`.
+    Pushing a move XORs out and in the features the move changes, popping restores the previous key from a stack. The
+    contribution of castling rights, en passant file and side to move is kept alongside the key, so that only the new
+    one has to be computed. Any other change to the position through the methods of the board clears the move stack or
+    transforms the board, both of which recompute the key from scratch."""
+
+    def __init__(self, fen: str | None = chess.STARTING_FEN, *, chess960: bool = False):
+        self.key: int = 0
+        self._state_key: int = 0
+        self._key_stack: list[tuple[int, int]] = []
+        super().__init__(fen, chess960=chess960)
+
+    def push(self, move: chess.Move) -> None:
+        key = self.key ^ self._state_key
+        from_square, to_square = move.from_square, move.to_square
+        piece_type = self.piece_type_at(from_square)
+
+        if (not move or piece_type == chess.KING and self.is_castling(move)
+                or piece_type == chess.PAWN and self.is_en_passant(move)):
+            squares = _touched_squares(self, move)
+            for square in squares:
+                key ^= _hash_square(self, square)
+
+            super().push(move)
+
+            for square in squares:
+                key ^= _hash_square(self, square)
+        else:
+            # all other moves only empty the from square and replace whatever is on the to square
+            turn = self.turn
+            key ^= POLYGLOT_RANDOM_ARRAY[64 * (2 * piece_type - 2 + turn) + from_square]
+            captured_piece_type = self.piece_type_at(to_square)
+            if captured_piece_type:
+                key ^= POLYGLOT_RANDOM_ARRAY[64 * (2 * captured_piece_type - 2 + (not turn)) + to_square]
+
+            super().push(move)
+
+            key ^= POLYGLOT_RANDOM_ARRAY[64 * (2 * (move.promotion or piece_type) - 2 + turn) + to_square]
+
+        self._key_stack.append((self.key, self._state_key))
+        self._state_key = _hash_state(self)
+        self.key = key ^ self._state_key
+
+    def pop(self) -> chess.Move:
+        move = super().pop()
+        self.key, self._state_key = self._key_stack.pop()
+        return move
+
+    def clear_stack(self) -> None:
+        super().clear_stack()
+        self._key_stack = []
+        self._rehash()
+
+    def apply_transform(self, f: Callable[[chess.Bitboard], chess.Bitboard]) -> None:
+        # the board clears its stack before it transforms the en passant square and castling rights
+        super().apply_transform(f)
+        self._rehash()
+
+    def apply_mirror(self) -> None:
+        # the board flips the side to move after the transformation
+        super().apply_mirror()
+        self._rehash()
+
+    def copy(self, *, stack: bool | int = True) -> "HashedBoard":
+        board = super().copy(stack=stack)
+        board.key = self.key
+        board._state_key = self._state_key
+        board._key_stack = self._key_stack[len(self._key_stack) - len(board.move_stack):]
+        return board
+
+    def root(self) -> "HashedBoard":
+        board = super().root()
+        board.clear_stack()
+        return board
+
+    def _rehash(self) -> None:
+        # recompute the key of the current position from scratch
+        self._state_key = _hash_state(self)
+        self.key = chess.polyglot.zobrist_hash(self)
+
+
+def _hash_square(board: chess.Board, square: chess.Square) -> int:
+    # random number of the piece on `square`, or zero for an empty square
+    piece_type = board.piece_type_at(square)
+    if piece_type is None:
+        return 0
+
+    color = bool(board.occupied_co[chess.WHITE] & chess.BB_SQUARES[square])
+    return POLYGLOT_RANDOM_ARRAY[PIECE_SQUARE_OFFSET + 64 * (2 * (piece_type - 1) + color) + square]
+
+
+def _hash_state(board: chess.Board) -> int:
+    # contributions of castling rights, en passant file and side to move
+    if board.chess960:
+        key = _chess960_castling_key(board)
+    else:
+        # like Polyglot, only hash castling rights that are valid, which they always are once a move has been pushed
+        key = _CASTLING_KEYS[board.clean_castling_rights() & CASTLING_CORNERS]
+
+    # like Polyglot, only hash the en passant file if a pawn is actually in place to capture
+    if board.ep_square is not None:
+        if board.turn == chess.WHITE:
+            ep_mask = chess.shift_down(chess.BB_SQUARES[board.ep_square])
+        else:
+            ep_mask = chess.shift_up(chess.BB_SQUARES[board.ep_square])
+        ep_mask = chess.shift_left(ep_mask) | chess.shift_right(ep_mask)
+
+        if ep_mask & board.pawns & board.occupied_co[board.turn]:
+            key ^= POLYGLOT_RANDOM_ARRAY[EN_PASSANT_OFFSET + chess.square_file(board.ep_square)]
+
+    if board.turn == chess.WHITE:
+        key ^= POLYGLOT_RANDOM_ARRAY[TURN_OFFSET]
+
+    return key
+
+
+def _castling_key(castling_rights: chess.Bitboard) -> int:
+    # contribution of the castling rights, given as rook squares
+    key = 0
+    for index, square in enumerate(CASTLING_SQUARES):
+        if castling_rights & chess.BB_SQUARES[square]:
+            key ^= POLYGLOT_RANDOM_ARRAY[CASTLING_OFFSET + index]
+    return key
+
+
+def _chess960_castling_key(board: chess.Board) -> int:
+    # contribution of the castling rights of a Chess960 board, whose castling rooks needn't stand in the corners, so the
+    # rights are looked up by side like Polyglot does
+    key = 0
+    for index, has_castling_rights in enumerate((
+            board.has_kingside_castling_rights(chess.WHITE), board.has_queenside_castling_rights(chess.WHITE),
+            board.has_kingside_castling_rights(chess.BLACK), board.has_queenside_castling_rights(chess.BLACK))):
+        if has_castling_rights:
+            key ^= POLYGLOT_RANDOM_ARRAY[CASTLING_OFFSET + index]
+    return key
+
+
+# contributions of all combinations of castling rights
+_CASTLING_KEYS = {castling_rights: _castling_key(castling_rights)
+                  for castling_rights in (sum(chess.BB_SQUARES[square]
+                                              for index, square in enumerate(CASTLING_SQUARES) if subset >> index & 1)
+                                          for subset in range(16))}
+
+
+def _touched_squares(board: chess.Board, move: chess.Move) -> tuple[chess.Square, ...]:
+    # squares whose occupation may change when `move` is pushed
+    if board.is_castling(move):
+        return tuple(chess.SQUARES[move.from_square & ~7:(move.from_square & ~7) + 8])
+
+    if board.is_en_passant(move):
+        return move.from_square, move.to_square, chess.square(chess.square_file(move.to_square),
+                                                              chess.square_rank(move.from_square))
+
+    return move.from_square, move.to_square
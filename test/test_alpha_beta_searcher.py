@@ -59,3 +59,117 @@ def test_finds_mates(fen_key, search_result):
     searcher = searchers.AlphaBetaSearcher(evaluator, depth=3)
 
     assert searcher.search(chess.Board(fens[fen_key])) == search_result
+
+
+@pytest.mark.parametrize("fen_key,score", [
+    ("starting", 0),
+    ("london", -100),
+    ("random-nonsense", -600)
+])
+def test_cached_search(fen_key, score):
+    """Test if the iteratively deepened search with cache finds the same scores as the plain search"""
+    evaluator = evaluators.SimpleEvaluator()
+    searcher = searchers.AlphaBetaSearcher(evaluator, depth=3, cachesize=10_000)
+
+    assert searcher.search(chess.Board(fens[fen_key])).score == score
+    assert searcher.cache.hits > 0
+
+
+@pytest.mark.parametrize("fen_key,search_result", [
+    ("fools-mate", SearchResult.from_mate(chess.WHITE, [chess.Move.from_uci("d1h5")])),
+])
+def test_cached_search_finds_mates(fen_key, search_result):
+    """Test if the search algorithm with cache finds shallow mates"""
+    evaluator = evaluators.SimpleEvaluator()
+    searcher = searchers.AlphaBetaSearcher(evaluator, depth=3, cachesize=10_000)
+
+    assert searcher.search(chess.Board(fens[fen_key])) == search_result
+
+
+def test_principal_variation_kept_between_iterations():
+    """The searcher should remember the principal variation of the last iteration"""
+    evaluator = evaluators.SimpleEvaluator()
+    searcher = searchers.AlphaBetaSearcher(evaluator, depth=3, cachesize=10_000)
+
+    search_result = searcher.search(chess.Board(fens["london"]))
+
+    assert searcher.principal_variation == search_result.moves
+    assert len(search_result.moves) == 3
+
+
+@pytest.mark.parametrize("fen_key", ["starting", "london", "random-nonsense"])
+def test_principal_variation_is_legal(fen_key):
+    """The moves of the result should be a sequence of legal moves from the searched position down to the leaf"""
+    evaluator = evaluators.SimpleEvaluator()
+    searcher = searchers.AlphaBetaSearcher(evaluator, depth=3)
+    board = chess.Board(fens[fen_key])
+
+    search_result = searcher.search(board)
+
+    assert isinstance(search_result.moves, list)
+    assert len(search_result.moves) == 3
+    for move in search_result.moves:
+        assert move in board.legal_moves
+        board.push(move)
+    assert evaluator.eval(board) == search_result.score
+
+
+@pytest.mark.parametrize("fen_key", fens.keys())
+def test_aspiration_windows(fen_key):
+    """The iteratively deepened search with aspiration windows should find the scores of the full-window search"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+    board = chess.Board(fens[fen_key])
+
+    expected = searchers.AlphaBetaSearcher(evaluator, depth=4).search(board)
+    search_result = searchers.AlphaBetaSearcher(evaluator, depth=4, cachesize=100_000).search(board)
+
+    assert search_result.get_effective_score() == expected.get_effective_score()
+
+
+def test_quiescence_search():
+    """With quiescence search, the searcher shouldn't take a defended pawn with the queen at the search horizon"""
+    evaluator = evaluators.SimpleEvaluator()
+    board = chess.Board("4k3/8/2p5/3p4/8/8/8/3QK3 w - - 0 1")
+    queen_takes_pawn = chess.Move.from_uci("d1d5")
+
+    search_result = searchers.AlphaBetaSearcher(evaluator, depth=1).search(board)
+    assert search_result.moves == [queen_takes_pawn]
+    assert search_result.score == 800
+
+    search_result = searchers.AlphaBetaSearcher(evaluator, depth=1, quiescence=True).search(board)
+    assert search_result.moves != [queen_takes_pawn]
+    assert search_result.score == 700
+
+
+@pytest.mark.parametrize("fen_key", ["starting", "london", "random-nonsense"])
+def test_cached_quiescence_search(fen_key):
+    """The cached search with quiescence search should find the scores of the plain search with quiescence search"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+    board = chess.Board(fens[fen_key])
+
+    expected = searchers.AlphaBetaSearcher(evaluator, depth=3, quiescence=True).search(board)
+    search_result = searchers.AlphaBetaSearcher(evaluator, depth=3, cachesize=100_000, quiescence=True).search(board)
+
+    assert search_result.get_effective_score() == expected.get_effective_score()
+
+
+def test_results_of_consecutive_searches():
+    """The searcher reuses its results within a search, but a returned result must survive the next search"""
+    searcher = searchers.AlphaBetaSearcher(evaluators.SimpleHandCraftedEvaluator(), depth=2, cachesize=10_000)
+
+    first_result = searcher.search(chess.Board(fens["london"]))
+    first_moves, first_score = list(first_result.moves), first_result.score
+    second_result = searcher.search(chess.Board(fens["starting"]))
+
+    assert second_result is not first_result
+    assert (first_result.moves, first_result.score) == (first_moves, first_score)
+
+
+@pytest.mark.parametrize("cachesize", [None, 100_000])
+def test_integer_scores(cachesize):
+    """Scores are whole centi pawns, also when they are read back from the cache"""
+    searcher = searchers.AlphaBetaSearcher(evaluators.SimpleHandCraftedEvaluator(), depth=3, cachesize=cachesize)
+    search_result = searcher.search(chess.Board(fens["london"]))
+
+    assert type(search_result.score) is int
+    assert type(search_result.get_effective_score()) is int
@@ -0,0 +1,86 @@
+"""Test the cache for search results"""
+
+import chess
+
+from chessengine.cache import ChessCache, EvaluationCache
+from chessengine.zobrist import HashedBoard
+
+from .chess_test_data import fens
+
+
+def test_insert_and_retrieve():
+    """Inserted values should be retrievable together with their best move"""
+    cache = ChessCache(maxsize=1000)
+    key = ChessCache.get_cache_key(chess.Board(fens["london"]))
+    move = chess.Move.from_uci("e8g8")
+
+    assert not cache.contains(key, 0)
+    cache.insert_or_update(key, 3, -100, move)
+
+    assert cache.contains(key, 3)
+    assert not cache.contains(key, 4)
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+    assert cache.get_value(key) == -100
+    assert cache.get_entry(key).best_move == move
+
+    assert cache.get_entry(ChessCache.get_cache_key(chess.Board(fens["starting"]))) is None
+
+
+def test_cache_key_of_hashed_board():
+    """The cache key of a hashed board should be its incrementally maintained key"""
+    board = HashedBoard(fens["london"])
+    board.push_uci("e8g8")
+
+    assert ChessCache.get_cache_key(board) == board.key == ChessCache.get_cache_key(chess.Board(board.fen()))
+
+
+def test_depth_preferred_replacement():
+    """An entry of a position should only be replaced by one from an at least equally deep search"""
+    cache = ChessCache(maxsize=1000)
+    key = ChessCache.get_cache_key(chess.Board(fens["starting"]))
+
+    cache.insert_or_update(key, 3, 10)
+    cache.insert_or_update(key, 2, 20)
+    assert cache.get_value(key) == 10
+
+    cache.insert_or_update(key, 4, 30)
+    assert cache.get_value(key) == 30
+
+
+def test_promotion_move_roundtrip():
+    """Promotion moves should survive the packing into the cache"""
+    cache = ChessCache(maxsize=1)
+    key = ChessCache.get_cache_key(chess.Board(fens["random-nonsense"]))
+    move = chess.Move.from_uci("a7a8q")
+
+    cache.insert_or_update(key, 1, 0, move)
+    assert cache.get_entry(key).best_move == move
+
+
+def test_evaluation_cache():
+    """Evaluations should be retrievable by key until another position takes their slot"""
+    cache = EvaluationCache(maxsize=16)
+
+    assert cache.get(3) is None
+    cache.insert(3, 42)
+    assert cache.get(3) == 42
+
+    cache.insert(3 + 16, 7)
+    assert cache.get(3) is None
+    assert cache.get(3 + 16) == 7
+    assert cache.hits == 2
+    assert cache.misses == 2
+
+
+def test_shared_cache():
+    """Caches on the same buffer should see each other's entries"""
+    buffer = bytearray(ChessCache.buffer_size(1000))
+    cache = ChessCache(1000, buffer)
+    cache.clear()
+    key = ChessCache.get_cache_key(chess.Board(fens["london"]))
+
+    cache.insert_or_update(key, 3, -100, chess.Move.from_uci("e8g8"))
+
+    assert ChessCache(1000, buffer).get_entry(key) == cache.get_entry(key)
@@ -1,9 +1,13 @@
 """Test evaluators"""
 
+from pathlib import Path
+import subprocess
+import sys
+
 import chess
 import pytest
 
-from chessengine.evaluators import SimpleHandCraftedEvaluator, SimpleEvaluator
+from chessengine.evaluators import NumbaHandCraftedEvaluator, SimpleHandCraftedEvaluator, SimpleEvaluator
 
 from .chess_test_data import fens
 
@@ -20,6 +24,15 @@ def test_simple_evaluator(fen_key, score):
     assert evaluation == score
 
 
+def test_simple_evaluator_piece_values():
+    """Piece values overridden in a subclass should be used in the evaluation"""
+    class KnightLovingEvaluator(SimpleEvaluator):
+        PIECE_VALUES = {**SimpleEvaluator.PIECE_VALUES, chess.KNIGHT: 1000}
+
+    board = chess.Board("4k3/8/8/8/8/8/8/1N2K3 w - - 0 1")
+    assert KnightLovingEvaluator().eval(board) == 1000
+
+
 @pytest.mark.parametrize("fen_key,score", [
     ("starting", 0),
     ("london", 25),
@@ -30,3 +43,23 @@ def test_simple_hand_crafted_evaluator(fen_key, score):
     evaluator = SimpleHandCraftedEvaluator()
     evaluation = evaluator.eval(chess.Board(fens[fen_key]))
     assert evaluation == score
+
+
+@pytest.mark.parametrize("fen_key", fens.keys())
+def test_numba_hand_crafted_evaluator(fen_key):
+    """Test if the Numba-compiled evaluation agrees with the pure Python one"""
+    board = chess.Board(fens[fen_key])
+    assert NumbaHandCraftedEvaluator().eval(board) == SimpleHandCraftedEvaluator().eval(board)
+
+
+@pytest.mark.parametrize("evaluator", [SimpleEvaluator(), SimpleHandCraftedEvaluator(), NumbaHandCraftedEvaluator()])
+def test_eval_batch(evaluator):
+    """Evaluating a batch of positions should agree with evaluating them one by one"""
+    boards = [chess.Board(fen) for fen in fens.values()]
+    assert evaluator.eval_batch(boards).tolist() == [evaluator.eval(board) for board in boards]
+
+
+def test_numba_imported_lazily():
+    """Importing the engine shouldn't import numba, which only the Numba-compiled evaluator and searcher need"""
+    code = "import sys, chessengine.evaluators, chessengine.searchers; assert 'numba' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
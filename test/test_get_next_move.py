@@ -0,0 +1,51 @@
+"""Test finding the next move with a searcher"""
+
+import chess
+import pytest
+
+from chessengine import evaluators, get_next_move, searchers
+from chessengine.searchers import MATE_SCORE
+
+from .chess_test_data import fens
+
+
+@pytest.mark.parametrize("fen_key", fens.keys())
+def test_next_move_is_legal(fen_key):
+    """The next move should be a legal move and its value the value of the search"""
+    board = chess.Board(fens[fen_key])
+    searcher = searchers.AlphaBetaSearcher(evaluators.SimpleEvaluator(), depth=2)
+
+    move, value = get_next_move(board, searcher)
+
+    assert move in board.legal_moves
+    assert value == searcher.search(board).get_effective_score()
+
+
+def test_next_move_finds_mate():
+    """The next move should deliver mate if possible"""
+    board = chess.Board(fens["fools-mate"])
+    searcher = searchers.AlphaBetaSearcher(evaluators.SimpleEvaluator(), depth=3)
+
+    assert get_next_move(board, searcher) == (chess.Move.from_uci("d1h5"), MATE_SCORE - 1)
+
+
+def test_no_next_move_when_game_over():
+    """There should be no next move if the game is over"""
+    board = chess.Board(fens["fools-mate"])
+    board.push_uci("d1h5")
+    searcher = searchers.AlphaBetaSearcher(evaluators.SimpleEvaluator(), depth=3)
+
+    assert get_next_move(board, searcher) == (None, MATE_SCORE)
+
+
+@pytest.mark.parametrize("searcher_class", [searchers.AlphaBetaSearcher, searchers.MinimaxSearcher])
+def test_next_move_of_depth_zero_searcher(searcher_class):
+    """A searcher of depth zero only evaluates the position, so the next move is the best move one ply deep"""
+    board = chess.Board(fens["fools-mate"])
+    searcher = searcher_class(evaluators.SimpleEvaluator(), depth=0)
+    expected = searcher_class(evaluators.SimpleEvaluator(), depth=1).search(board)
+
+    move, value = get_next_move(board, searcher)
+
+    assert move in board.legal_moves
+    assert value == expected.get_effective_score()
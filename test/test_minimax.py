@@ -60,3 +60,16 @@ def test_finds_mates(fen_key, search_result):
     searcher = searchers.MinimaxSearcher(evaluator, depth=2)
 
     assert searcher.search(chess.Board(fens[fen_key])) == search_result
+
+
+@pytest.mark.parametrize("fen_key", ["starting", "london", "random-nonsense"])
+def test_batched_frontier(fen_key):
+    """With an evaluator that evaluates in batches, the leaves of frontier nodes are evaluated together, which should
+    find the same results as the alpha-beta search, which evaluates them one by one"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+    board = chess.Board(fens[fen_key])
+
+    search_result = searchers.MinimaxSearcher(evaluator, depth=2).search(board)
+    expected = searchers.AlphaBetaSearcher(evaluator, depth=2).search(board)
+
+    assert search_result.get_effective_score() == expected.get_effective_score()
@@ -0,0 +1,50 @@
+"""Test move ordering heuristics"""
+
+import chess
+
+from chessengine.searchers.move_ordering import history_index, order_moves
+
+from .chess_test_data import fens
+
+
+def test_best_move_first():
+    """The given best move should be searched first"""
+    board = chess.Board(fens["starting"])
+    best_move = chess.Move.from_uci("g1f3")
+
+    moves = order_moves(board, board.legal_moves, best_move)
+
+    assert moves[0] == best_move
+    assert sorted(moves, key=chess.Move.uci) == sorted(board.legal_moves, key=chess.Move.uci)
+
+
+def test_captures_by_mvv_lva():
+    """Captures should come first, the most valuable victim first and the least valuable attacker first among those"""
+    board = chess.Board(fens["random-nonsense"])
+
+    moves = order_moves(board, board.legal_moves)
+
+    # the queen on c3 is taken by pawn or bishop, the bishop on d1 by the king
+    assert moves[:3] == [chess.Move.from_uci("b2c3"), chess.Move.from_uci("d2c3"), chess.Move.from_uci("e1d1")]
+
+
+def test_en_passant_is_capture():
+    """En passant moves should be ordered like pawn captures"""
+    board = chess.Board("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3")
+
+    assert order_moves(board, board.legal_moves)[0] == chess.Move.from_uci("e5f6")
+
+
+def test_killers_and_history():
+    """Killer moves should follow the captures, and the other quiet moves should be ordered by their history counters"""
+    board = chess.Board(fens["random-nonsense"])
+    killer = chess.Move.from_uci("a2a3")
+    quiet = chess.Move.from_uci("h2h3")
+
+    history = [0] * (2 * 7 * 64)
+    history[history_index(board, quiet)] = 1
+
+    moves = order_moves(board, board.legal_moves, killers=(killer, None), history=history)
+
+    assert [board.is_capture(move) for move in moves[:4]] == [True, True, True, False]
+    assert moves[3:5] == [killer, quiet]
@@ -0,0 +1,76 @@
+"""Test the Numba-compiled Alpha-Beta search"""
+
+import chess
+import pytest
+
+from chessengine import evaluators, searchers
+from chessengine.searchers import _numba_search, SearchResult
+
+from .chess_test_data import fens
+
+PERFT_FENS = {
+    "kiwipete": "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "endgame": "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "promotions": "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+}
+
+INSUFFICIENT_MATERIAL_FENS = {
+    "same-colored-bishops": "8/8/4k3/3b4/2B5/8/4K3/8 w - - 0 1",
+    "knight-against-queen": "8/8/4k3/3q4/2N5/8/4K3/8 w - - 0 1",
+}
+
+
+def _perft(board: chess.Board, depth: int) -> int:
+    if depth == 0:
+        return 1
+
+    nodes = 0
+    for move in board.legal_moves:
+        board.push(move)
+        nodes += _perft(board, depth - 1)
+        board.pop()
+    return nodes
+
+
+@pytest.mark.parametrize("fen", list(fens.values()) + list(PERFT_FENS.values()))
+def test_move_generator(fen):
+    """The kernel should generate the same number of positions as python-chess, including castling, en passant and
+    promotions"""
+    board = chess.Board(fen)
+    searcher = searchers.NumbaAlphaBetaSearcher(evaluators.SimpleHandCraftedEvaluator(), depth=3)
+    searcher.set_up(board)
+
+    # pylint: disable=protected-access
+    assert _numba_search.perft(searcher._bitboards, searcher._mailboxes, searcher._states, searcher._moves, 0, 3) \
+        == _perft(board, 3)
+
+
+@pytest.mark.parametrize("fen", list(fens.values()) + list(PERFT_FENS.values())
+                         + list(INSUFFICIENT_MATERIAL_FENS.values()))
+@pytest.mark.parametrize("depth", [0, 1, 2, 3])
+def test_agrees_with_alpha_beta_searcher(fen, depth):
+    """The kernel should find the same results as the Alpha-Beta searcher in Python"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+    board = chess.Board(fen)
+
+    result = searchers.NumbaAlphaBetaSearcher(evaluator, depth).search(board)
+    expected = searchers.AlphaBetaSearcher(evaluator, depth).search(board)
+
+    assert result.type == expected.type
+    assert result == expected
+
+
+def test_finds_mates():
+    """Test if the Numba search finds shallow mates"""
+    searcher = searchers.NumbaAlphaBetaSearcher(evaluators.SimpleHandCraftedEvaluator(), depth=3)
+
+    assert searcher.search(chess.Board(fens["fools-mate"])) \
+        == SearchResult.from_mate(chess.WHITE, [chess.Move.from_uci("d1h5")])
+
+
+def test_rejects_chess960():
+    """The kernel only knows standard castling, so it shouldn't accept Chess960 boards"""
+    searcher = searchers.NumbaAlphaBetaSearcher(evaluators.SimpleHandCraftedEvaluator(), depth=1)
+
+    with pytest.raises(AssertionError):
+        searcher.set_up(chess.Board(chess960=True))
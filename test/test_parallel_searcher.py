@@ -0,0 +1,101 @@
+"""Test searching the root moves in parallel processes"""
+
+import multiprocessing
+
+import chess
+import pytest
+
+from chessengine import evaluators, searchers
+from chessengine.cache import ChessCache
+from chessengine.searchers import parallel_searcher
+from chessengine.searchers import SearchResult
+
+from .chess_test_data import fens
+
+
+@pytest.mark.parametrize("fen_key", ["starting", "london", "random-nonsense"])
+def test_parallel_search_agrees_with_serial(fen_key):
+    """Searching the root moves in parallel should find the score of a serial search one ply deeper"""
+    evaluator = evaluators.SimpleEvaluator()
+    parallel_searcher = searchers.ParallelRootSearcher(searchers.AlphaBetaSearcher(evaluator, depth=1), max_workers=2)
+    serial_searcher = searchers.AlphaBetaSearcher(evaluator, depth=2)
+
+    board = chess.Board(fens[fen_key])
+    result = parallel_searcher.search(board)
+
+    assert result.score == serial_searcher.search(board).score
+    assert result.moves[0] in board.legal_moves
+
+
+def test_parallel_search_finds_mates():
+    """Test if the parallel search finds shallow mates"""
+    evaluator = evaluators.SimpleEvaluator()
+    searcher = searchers.ParallelRootSearcher(searchers.AlphaBetaSearcher(evaluator, depth=2), max_workers=2)
+
+    assert searcher.search(chess.Board(fens["fools-mate"])) == \
+        SearchResult.from_mate(chess.WHITE, [chess.Move.from_uci("d1h5")])
+
+
+@pytest.mark.parametrize("fen_key", ["starting", "london", "random-nonsense"])
+def test_lazy_smp_search_agrees_with_serial(fen_key):
+    """A Lazy SMP search without helpers should find the result of a serial search with a cache"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+    serial_searcher = searchers.AlphaBetaSearcher(evaluator, depth=2, cachesize=10_000)
+
+    board = chess.Board(fens[fen_key])
+    with searchers.LazySMPSearcher(evaluator, depth=2, cachesize=10_000, max_workers=1) as lazy_smp_searcher:
+        result = lazy_smp_searcher.search(board)
+    expected = serial_searcher.search(board)
+
+    assert (result.score, result.moves) == (expected.score, expected.moves)
+
+
+@pytest.mark.parametrize("max_workers", [2, 3])
+def test_lazy_smp_search_depth(max_workers):
+    """The result should be that of the main search to the given depth, however many helpers search deeper"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+    board = chess.Board(fens["london"])
+
+    with searchers.LazySMPSearcher(evaluator, depth=2, cachesize=10_000, max_workers=max_workers) as searcher:
+        result = searcher.search(board)
+
+    assert 1 <= len(result.moves) <= 2
+    assert result.moves[0] in board.legal_moves
+
+
+def test_lazy_smp_searcher_keeps_its_processes():
+    """Consecutive searches should run in the same pool of processes, which is shut down on closing the searcher"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+
+    with searchers.LazySMPSearcher(evaluator, depth=2, cachesize=10_000, max_workers=2) as searcher:
+        searcher.search(chess.Board(fens["starting"]))
+        pool = searcher._pool  # pylint: disable=protected-access
+        result = searcher.search(chess.Board(fens["london"]))
+
+        assert searcher._pool is pool  # pylint: disable=protected-access
+        assert result.moves[0] in chess.Board(fens["london"]).legal_moves
+
+    assert searcher._pool is None  # pylint: disable=protected-access
+
+
+def test_lazy_smp_helpers():
+    """Helpers should order their moves differently but find the same score, and abort once the main search is done"""
+    evaluator = evaluators.SimpleHandCraftedEvaluator()
+    board = chess.Board(fens["london"])
+    stop = multiprocessing.RawValue("b", 0)
+    cachesize = 10_000
+
+    buffer = bytearray(ChessCache.buffer_size(cachesize))
+
+    # pylint: disable=protected-access
+    helper = parallel_searcher._LazySMPWorkerSearcher(evaluator, cachesize, buffer, stop)
+    helper.cache.clear()
+    helper.depth, helper.worker = 2, 1
+
+    result = helper.search(board)
+    assert helper.history != [0] * len(helper.history)
+    assert result.score == searchers.AlphaBetaSearcher(evaluator, depth=2).search(board).score
+
+    stop.value = 1
+    with pytest.raises(parallel_searcher._SearchAborted):
+        helper.search(board)
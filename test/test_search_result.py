@@ -9,7 +9,9 @@ from chessengine.searchers import SearchResult, SearchResultType
 def test_search_result_direct_instantiation():
     """It should be impossible to instantiate `SearchResult` directly."""
     with pytest.raises(TypeError):
-        SearchResult()
+        SearchResult()  # pylint: disable=no-value-for-parameter
+    with pytest.raises(TypeError):
+        SearchResult(SearchResultType.DRAW, [], None, None, 0.0)
 
 
 def test_search_result_from_score():
@@ -65,3 +67,34 @@ def test_search_result_shorter_mates_better():
 
     assert long_white_mate < short_white_mate
     assert short_black_mate < long_black_mate
+
+
+def test_search_result_attributes():
+    """All factory methods should set every attribute"""
+    score_result = SearchResult.from_score(50, [])
+    mate_result = SearchResult.from_mate(chess.BLACK, [chess.Move.null()])
+    draw_result = SearchResult.from_draw([])
+
+    assert (score_result.score, score_result.winner) == (50, None)
+    assert (mate_result.score, mate_result.winner) == (None, chess.BLACK)
+    assert (draw_result.score, draw_result.winner) == (None, None)
+    assert not hasattr(score_result, "__dict__")
+
+
+def test_search_result_in_place():
+    """Setting a result in place should give the same attributes as the corresponding factory method"""
+    moves = [chess.Move.null()]
+    result = SearchResult.from_draw([])
+
+    result.set_mate(chess.BLACK, moves)
+    expected = SearchResult.from_mate(chess.BLACK, moves)
+    assert (result.type, result.moves, result.score, result.winner, result.effective_score) == \
+        (expected.type, expected.moves, expected.score, expected.winner, expected.effective_score)
+
+    result.set_score(50, moves)
+    assert (result.type, result.score, result.winner, result.effective_score) == (SearchResultType.SCORE, 50, None, 50)
+
+    copy = SearchResult.from_draw([])
+    copy.copy_from(result)
+    assert (copy.type, copy.moves, copy.score, copy.winner, copy.effective_score) == \
+        (result.type, result.moves, result.score, result.winner, result.effective_score)
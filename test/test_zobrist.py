@@ -0,0 +1,104 @@
+"""Test Zobrist hashing"""
+
+import random
+
+import chess
+import chess.polyglot
+import pytest
+
+from chessengine.zobrist import HashedBoard
+
+from .chess_test_data import fens
+
+
+@pytest.mark.parametrize("fen_key", fens.keys())
+def test_key_matches_polyglot(fen_key):
+    """The key of a freshly set up board should agree with the Polyglot Zobrist hash"""
+    board = HashedBoard(fens[fen_key])
+    assert board.key == chess.polyglot.zobrist_hash(board)
+
+
+@pytest.mark.parametrize("seed,chess960", [(seed, False) for seed in range(5)] + [(seed, True) for seed in range(5)])
+def test_incremental_key(seed, chess960):
+    """The incrementally maintained key should agree with the hash computed from scratch for random games, also for
+    Chess960 starting positions, where the castling rooks needn't stand in the corners"""
+    rng = random.Random(seed)
+    board = HashedBoard(chess960=chess960)
+    if chess960:
+        board.set_chess960_pos(rng.randrange(960))
+    keys = [board.key]
+
+    while not board.is_game_over() and len(board.move_stack) < 300:
+        board.push(rng.choice(list(board.legal_moves)))
+        assert board.key == chess.polyglot.zobrist_hash(board)
+        keys.append(board.key)
+
+    while board.move_stack:
+        keys.pop()
+        board.pop()
+        assert board.key == keys[-1]
+
+
+@pytest.mark.parametrize("fen,uci", [
+    ("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1", "e1g1"),
+    ("r3k2r/pppppppp/8/8/8/8/PPPPPPPP/R3K2R b KQkq - 0 1", "e8c8"),
+    ("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3", "e5f6"),
+    ("8/1P4k1/8/8/8/8/6K1/8 w - - 0 1", "b7b8n"),
+])
+def test_incremental_key_special_moves(fen, uci):
+    """Castling, en passant and promotions should be hashed correctly"""
+    board = HashedBoard(fen)
+    board.push_uci(uci)
+    assert board.key == chess.polyglot.zobrist_hash(board)
+
+
+def test_key_after_other_changes():
+    """Copies and positions set up without pushing moves should have correct keys"""
+    board = HashedBoard()
+    board.push_uci("e2e4")
+    board.push_uci("e7e5")
+
+    copy = board.copy()
+    assert copy.key == board.key
+    copy.pop()
+    assert copy.key == chess.polyglot.zobrist_hash(copy)
+
+    assert board.root().key == chess.polyglot.zobrist_hash(chess.Board())
+
+    board.set_fen(fens["london"])
+    assert board.key == chess.polyglot.zobrist_hash(board)
+
+
+def test_mirrored_key():
+    """Mirroring the board also flips the side to move, which the key should reflect"""
+    board = HashedBoard(fens["london"])
+    mirrored = board.mirror()
+    assert mirrored.key == chess.polyglot.zobrist_hash(mirrored)
+
+    board.apply_mirror()
+    assert board.key == mirrored.key
+
+
+def test_invalid_castling_rights_key():
+    """Castling rights without king and rook in place aren't hashed, neither before nor after a move"""
+    board = HashedBoard("4k3/8/8/8/8/8/8/4K3 w KQkq - 0 1")
+    assert board.key == chess.polyglot.zobrist_hash(board)
+
+    board.push_uci("e1e2")
+    assert board.key == chess.polyglot.zobrist_hash(board)
+
+
+def test_chess960_castling_key():
+    """Castling rights with a castling rook outside the corners should be hashed like Polyglot does"""
+    board = HashedBoard("nrq1bnkr/p2p1ppp/8/1pp1p1b1/P2P4/1N5P/1PPBPPP1/1RQB1NKR w KQkq - 2 7", chess960=True)
+    assert board.key == chess.polyglot.zobrist_hash(board)
+
+    board.push_uci("b1a1")
+    assert board.key == chess.polyglot.zobrist_hash(board)
+
+
+def test_null_move_key():
+    """Pushing a null move should only change the side to move and en passant file"""
+    board = HashedBoard("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3")
+    board.push(chess.Move.null())
+    assert board.key == chess.polyglot.zobrist_hash(board)